@@ -0,0 +1,55 @@
+'''
+Create a new scene with an armature and a mirrored cube (negative scale)
+parented to its bone, export the model to the path passed in arguments and
+save the cube size expected by the exporter to the second path.
+
+The expected size uses the scale from matrix_world.decompose() - the scale
+that was always used by the exporter.
+'''
+import sys
+import json
+import bpy
+import numpy as np
+
+
+# Collect arguments after "--"
+argv = sys.argv
+argv = argv[argv.index("--") + 1:]
+
+
+def main(target_path: str, expected_path: str):
+    '''Main function.'''
+    scene = bpy.data.scenes.new('mirrored_cube')
+    bpy.context.window.scene = scene
+
+    armature_data = bpy.data.armatures.new('armature')
+    armature = bpy.data.objects.new('armature', armature_data)
+    scene.collection.objects.link(armature)
+    bpy.context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    bone = armature_data.edit_bones.new('bone')
+    bone.head = (0, 0, 0)
+    bone.tail = (0, 0, 1)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    bpy.ops.mesh.primitive_cube_add(size=2)
+    cube = bpy.context.object
+    cube.parent = armature
+    cube.parent_type = 'BONE'
+    cube.parent_bone = 'bone'
+    cube.scale = (-1, 1, 1)
+    bpy.context.view_layer.update()
+
+    bound_box = np.array(cube.bound_box)
+    _, _, scale = cube.matrix_world.decompose()
+    expected_size = (
+        (bound_box[6] - bound_box[0])[[0, 2, 1]] *
+        np.array(scale.xzy) * 16)
+    with open(expected_path, 'w', encoding='utf8') as f:
+        json.dump({'size': expected_size.tolist()}, f)
+
+    bpy.context.view_layer.objects.active = armature
+    bpy.ops.mcblend.export_model(filepath=target_path)
+
+if __name__ == "__main__":
+    main(argv[0], argv[1])
@@ -72,7 +72,8 @@ def get_unused_event_name(base_name: str, i=1):
     '''
     events = get_mcblend_events(bpy.context.scene)
     name = base_name
-    while name in events.keys():
+    used_names = set(events.keys())
+    while name in used_names:
         name = f'{base_name}.{i:04}'
         i += 1
     return name
@@ -108,9 +109,7 @@ def _set_event_name(self: 'MCBLEND_EventProperties', value: str):
         _update_event_name(self, value)
 
 def _get_event_name(self):
-    if 'name' not in self:
-        return ''
-    return self['name']
+    return self.get('name', '')
 
 class MCBLEND_EventProperties(PropertyGroup):
     '''
@@ -25,7 +25,7 @@ from .animation import AnimationExport
 from .common import (
     MINECRAFT_SCALE_FACTOR, CubePolygon, McblendObject, McblendObjectGroup, MeshType,
     apply_obj_transform_keep_origin, fix_cube_rotation, star_pattern_match,
-    MCObjType)
+    MCObjType, get_uv_layer_crds, set_uv_layer_crds)
 from .extra_types import Vector2di
 from .importer import ImportGeometry, ModelLoader
 from .material import create_bone_material
@@ -34,6 +34,12 @@ from .uv import CoordinatesConverter, UvMapper, UvModelMerger
 from .db_handler import get_db_handler
 from .rp_importer import PksForModelImport
 
+# The orders of the corners of a UV face (left down, right down, right up,
+# left up) after: no flip, flipping left right, flipping up down and
+# flipping both
+_UV_CORNER_FLIPS = np.array([
+    [0, 1, 2, 3], [1, 0, 3, 2], [2, 3, 0, 1], [3, 2, 1, 0]])
+
 
 def export_model(
         context: Context) -> Tuple[Dict[str, Any], Iterable[str]]:
@@ -225,9 +231,12 @@ def fix_uvs(context: Context) -> Vector2di:
             continue
         polygons = objprop.cube_polygons()
         uv_layer = objprop.obj_data.uv_layers.active
+        # The UVs of all of the loops are read and written at once
+        loop_crds = get_uv_layer_crds(uv_layer).astype(np.float64)
         fixed_faces = 0
         for polygon in polygons:
-            crds = polygon.uv_layer_coordinates(uv_layer)
+            ordered_loop_indices = polygon.ordered_loop_indices
+            crds = loop_crds[ordered_loop_indices]
             if CubePolygon.validate_rectangle_uv(crds)[0]:
                 continue  # The UVs are correct already
 
@@ -239,40 +248,24 @@ def fix_uvs(context: Context) -> Vector2di:
                 max_, [min_[0], max_[1]]
             ])
             # Try connecting crds to the closest corners of the "bound box"
-            # of the UV
-            new_crds = np.empty((4, 2))
-            first_index: Optional[int] = None
-            for i in range(4):
-                distances = np.linalg.norm(expected - crds[i], axis=1)
-                # First result of where, first (and only) coordinate -> [0][0]
-                index = np.where(distances == np.min(distances))[0][0]
-                if first_index is None:
-                    first_index = index
-                new_crds[i] = expected[index]
-
-            if not (  # Still not valid. Rearrange based on left down
-                    np.allclose(new_crds, expected) or
-                    np.allclose(new_crds, expected[[1, 0, 3, 2]]) or  # flip left right
-                    np.allclose(new_crds, expected[[2, 3, 0, 1]]) or  # flip up down
-                    np.allclose(new_crds, expected[[3, 2, 1, 0]])  # flip both
-            ):
-                if first_index == 0:
-                    new_crds = expected
-                elif first_index == 1:
-                    new_crds = expected[[1, 0, 3, 2]]
-                elif first_index == 2:
-                    new_crds = expected[[2, 3, 0, 1]]
-                elif first_index == 3:
-                    new_crds = expected[[3, 2, 1, 0]]
-                else:
-                    raise RuntimeError('Invalid state')
+            # of the UV (4x4 distances, one row for each of the crds)
+            distances = np.linalg.norm(
+                crds[:, np.newaxis] - expected, axis=-1)
+            # First index of the minimal distance for each of the crds
+            closest = distances.argmin(axis=1)
+            new_crds = expected[closest]
+
+            # The valid orders of the corners: no flip, flip left right,
+            # flip up down, flip both
+            valid_crds = expected[_UV_CORNER_FLIPS]
+            # Still not valid. Rearrange based on left down
+            if not np.isclose(new_crds, valid_crds).all(axis=(1, 2)).any():
+                new_crds = valid_crds[closest[0]]
             # Apply new_crds to the UV
-            ordered_loop_indices = np.array(
-                polygon.side.loop_indices)[polygon.order,]
-            for i, loop_index in enumerate(ordered_loop_indices):
-                uv_layer.data[loop_index].uv = new_crds[i]
+            loop_crds[ordered_loop_indices] = new_crds
             fixed_faces += 1
         if fixed_faces > 0:
+            set_uv_layer_crds(uv_layer, loop_crds)
             total_fixed_cubes += 1
             total_fixed_uv_faces += fixed_faces
     return total_fixed_cubes, total_fixed_uv_faces
@@ -17,7 +17,7 @@ import numpy as np
 from .json_tools import get_vect_json
 from .common import (
     AnimationLoopType, MINECRAFT_SCALE_FACTOR, MCObjType, McblendObjectGroup,
-    ANIMATION_TIMESTAMP_PRECISION, NumpyTable
+    ANIMATION_TIMESTAMP_PRECISION, NumpyTable, XZY_INDICES
 )
 
 
@@ -207,15 +207,18 @@ class Pose:
 
         :param object_properties: group of mcblend objects.
         '''
+        # The poses are loaded after changing the frame of the animation so
+        # the cached transformations of the objects are outdated.
+        object_properties.clear_cache()
         for objprop in object_properties.values():
             if objprop.mctype == MCObjType.BONE:
                 # Scale
                 local_matrix = objprop.get_local_matrix(
                     objprop.parent, normalize=False)
-                scale = np.array(local_matrix.to_scale())[[0, 2, 1]]
+                scale = np.array(local_matrix.to_scale())[XZY_INDICES]
                 # Location
                 location = np.array(local_matrix.to_translation())
-                location = location[[0, 2, 1]] * MINECRAFT_SCALE_FACTOR
+                location = location[XZY_INDICES] * MINECRAFT_SCALE_FACTOR
                 # Rotation
                 rotation = objprop.get_mcrotation(objprop.parent)
                 if objprop.parent is not None:
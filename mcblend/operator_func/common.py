@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from ctypes import c_int
 import math
+import sys
 from enum import Enum
 from typing import (
     Dict, Iterator, NamedTuple, List, Optional, Tuple, Any, Iterable,
@@ -37,6 +38,14 @@ ANIMATION_TIMESTAMP_PRECISION = 2
 The number of decimal places in timestamps in animations to use during export.
 '''
 
+XZY_INDICES = np.array([0, 2, 1], dtype=np.intp)
+'''
+Index array that swaps the Y and Z axes of a vector. Converts vectors between
+the Blender and Minecraft coordinates systems.
+'''
+
+_RAD_TO_DEG = 180.0 / math.pi
+
 class ModelOriginType(Enum):
     '''Defines what should be used as the origin of the model.'''
     WORLD = 'world'
@@ -54,6 +63,15 @@ class MCObjType(Enum):
     BONE = 'BONE'
     LOCATOR = 'LOCATOR'
 
+_OBJ_TYPE_TO_MCTYPE: dict[str, MCObjType] = {
+    'MESH': MCObjType.CUBE,
+    'EMPTY': MCObjType.LOCATOR,
+}
+'''
+The types of Minecraft objects created from the children of the bones, by
+the type of blender object.
+'''
+
 class MeshType(Enum):
     '''
     Type of the exported mesh. Changes the way of representation of this
@@ -77,6 +95,15 @@ class ObjectId(NamedTuple):
     name: str
     bone_name: str
 
+    @classmethod
+    def make(cls, name: str, bone_name: str = '') -> ObjectId:
+        '''
+        Creates :class:`ObjectId` with interned names. Equal names share the
+        same string object so the dictionary lookups by ObjectId can compare
+        them by identity.
+        '''
+        return cls(sys.intern(name), sys.intern(bone_name))
+
 class McblendObject:
     '''
     A class that wraps Blender objects (meshes, empties and bones) and
@@ -92,12 +119,21 @@ class McblendObject:
     :param group: The :class:`McblendObjectGroup` that stores all of the
         :class:`McblendObject`s being processed with this object.
     '''
+    __slots__ = (
+        'thisobj_id', 'thisobj', 'parentobj_id', 'children_ids', 'mctype',
+        'group', '_obj_matrix_world_cache', '_obj_name_cache',
+        '_mcpivot_cache', '_obj_bound_box_cache')
+
     thisobj_id: ObjectId
     thisobj: Object
     parentobj_id: ObjectId | None
     children_ids: list[ObjectId]
     mctype: MCObjType
     group: McblendObjectGroup
+    _obj_matrix_world_cache: Matrix | None
+    _obj_name_cache: str | None
+    _mcpivot_cache: Vector | None
+    _obj_bound_box_cache: NumpyTable | None
 
     def __init__(
             self, thisobj_id: ObjectId, thisobj: Object,
@@ -109,6 +145,21 @@ class McblendObject:
         self.children_ids = children_ids
         self.mctype = mctype
         self.group = group
+        self._obj_matrix_world_cache = None
+        self._obj_name_cache = None
+        self._mcpivot_cache = None
+        self._obj_bound_box_cache = None
+
+    def clear_cache(self):
+        '''
+        Clears the cached values of the properties that depend on the
+        transformations of the blender object (the :code:`obj_matrix_world`
+        and the values derived from it). Should be called whenever the
+        transformations change, for example after changing the frame of the
+        animation.
+        '''
+        self._obj_matrix_world_cache = None
+        self._mcpivot_cache = None
 
     @property
     def parent(self) -> Optional[McblendObject]:
@@ -195,11 +246,16 @@ class McblendObject:
     @property
     def obj_name(self) -> str:
         '''The name of this object used for exporting to Minecraft model.'''
-        if self.thisobj.type == 'ARMATURE':
-            return self.thisobj.pose.bones[
-                self.thisobj_id.bone_name
-            ].name
-        return self.thisobj.name
+        obj_name = self._obj_name_cache
+        if obj_name is None:
+            if self.thisobj.type == 'ARMATURE':
+                obj_name = self.thisobj.pose.bones[
+                    self.thisobj_id.bone_name
+                ].name
+            else:
+                obj_name = self.thisobj.name
+            self._obj_name_cache = obj_name
+        return obj_name
 
     @property
     def obj_type(self) -> str:
@@ -214,24 +270,50 @@ class McblendObject:
         '''The bound_box of the blender object wrapped inside this object.'''
         return self.thisobj.bound_box
 
+    @property
+    def _obj_bound_box_array(self) -> NumpyTable:
+        '''
+        The bound_box of the blender object wrapped inside this object as
+        8x3 numpy array. The bound box is in the local space of the object so
+        it doesn't depend on the transformations and it's cached for the
+        whole lifetime of this object.
+        '''
+        bound_box = self._obj_bound_box_cache
+        if bound_box is None:
+            bound_box = np.array(self.thisobj.bound_box)
+            self._obj_bound_box_cache = bound_box
+        return bound_box
+
     @property
     def obj_matrix_world(self) -> Matrix:
         '''
         The copy of the translation matrix (matrix_world) of the blender
         wrapped inside this object.
+
+        The value is cached until :meth:`clear_cache` is called.
         '''
-        this_obj_matrix_world = self.thisobj.matrix_world.copy()
-        if self.group.world_origin is not None:
-            this_obj_matrix_world = (
-                self.group.world_origin.matrix_world.inverted() @
-                this_obj_matrix_world
-            )
-        if self.thisobj.type == 'ARMATURE':
-            return (
-                this_obj_matrix_world @
-                self.thisobj.pose.bones[self.thisobj_id.bone_name].matrix.copy()
-            )
-        return this_obj_matrix_world
+        this_obj_matrix_world = self._obj_matrix_world_cache
+        if this_obj_matrix_world is None:
+            # The matrix multiplications create new matrices, the matrix of
+            # the object must be copied only if it's not transformed.
+            this_obj_matrix_world = self.thisobj.matrix_world
+            world_origin = self.group.world_origin
+            if world_origin is not None:
+                this_obj_matrix_world = (
+                    world_origin.matrix_world.inverted() @
+                    this_obj_matrix_world
+                )
+            if self.thisobj.type == 'ARMATURE':
+                this_obj_matrix_world = (
+                    this_obj_matrix_world @
+                    self.thisobj.pose.bones[
+                        self.thisobj_id.bone_name].matrix
+                )
+            elif world_origin is None:
+                this_obj_matrix_world = this_obj_matrix_world.copy()
+            self._obj_matrix_world_cache = this_obj_matrix_world
+        # Return a copy because the callers are allowed to modify the matrix
+        return this_obj_matrix_world.copy()
 
     @property
     def mcube_size(self) -> NumpyTable:
@@ -240,8 +322,8 @@ class McblendObject:
         blender object wrapped inside this object.
         '''
         # 0. ---; 1. --+; 2. -++; 3. -+-; 4. +--; 5. +-+; 6. +++; 7. ++-
-        bound_box = self.obj_bound_box
-        return (np.array(bound_box[6]) - np.array(bound_box[0]))[[0, 2, 1]]
+        bound_box = self._obj_bound_box_array
+        return (bound_box[6] - bound_box[0])[XZY_INDICES]
 
     @property
     def mccube_position(self) -> NumpyTable:
@@ -249,12 +331,15 @@ class McblendObject:
         The cube position in Minecraft format based on the bounding box of
         the blender object wrapped inside this object.
         '''
-        return np.array(self.obj_bound_box[0])[[0, 2, 1]]
+        return self._obj_bound_box_array[0][XZY_INDICES]
 
     @property
     def mcpivot(self) -> NumpyTable:
         '''
         The pivot point of Minecraft object exported using this object.
+
+        The pivots of this object and its ancestors are cached until
+        :meth:`clear_cache` is called.
         '''
         def local_crds(
                 parent: McblendObject, child: McblendObject
@@ -267,15 +352,24 @@ class McblendObject:
             return child.get_local_matrix(
                 parent, normalize=True).to_translation()
 
-        def _get_mcpivot(objprop: McblendObject) -> Vector:
-            if objprop.parent is not None:
-                result = local_crds(objprop.parent, objprop)
-                result = result + _get_mcpivot(objprop.parent)
-            else:
-                result = objprop.obj_matrix_world.to_translation()
-            return result
-
-        return np.array(_get_mcpivot(self).xzy)
+        if self._mcpivot_cache is None:
+            # Find the objects without cached pivot (self and its ancestors)
+            uncached: List[McblendObject] = []
+            objprop: Optional[McblendObject] = self
+            while objprop is not None and objprop._mcpivot_cache is None:
+                uncached.append(objprop)
+                objprop = objprop.parent
+            # Calculate the pivots starting from the top of the hierarchy
+            for objprop in reversed(uncached):
+                parent = objprop.parent
+                if parent is not None:
+                    objprop._mcpivot_cache = (
+                        local_crds(parent, objprop) +
+                        cast(Vector, parent._mcpivot_cache))
+                else:
+                    objprop._mcpivot_cache = (
+                        objprop.obj_matrix_world.to_translation())
+        return np.array(cast(Vector, self._mcpivot_cache).xzy)
 
     def get_local_matrix(
             self, other: Optional[McblendObject] = None, normalize: bool = False
@@ -332,10 +426,11 @@ class McblendObject:
             )
         else:
             result_euler = self.obj_matrix_world.to_euler('XZY')
-        result: NumpyTable = np.array(result_euler)[[0, 2, 1]]
-        result = result * np.array([1, -1, 1])
-        result = result * 180/math.pi  # math.degrees() for array
-        return result
+        # Swap Y and Z axes, negate the Z rotation and convert to degrees
+        return np.array((
+            result_euler.x * _RAD_TO_DEG,
+            -result_euler.z * _RAD_TO_DEG,
+            result_euler.y * _RAD_TO_DEG))
 
     def cube_polygons(self) -> CubePolygons:
         '''
@@ -350,9 +445,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 1 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((0, 1, 0))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side1)
 
     @property
@@ -361,9 +457,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 2 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((1, 0, 1))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side2)
 
     @property
@@ -372,9 +469,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 3 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((1, 0, 0))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side3)
 
     @property
@@ -383,9 +481,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 4 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((0, 1, 1))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side4)
 
     @property
@@ -394,9 +493,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 5 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((0, 0, 1))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side5)
 
     @property
@@ -405,9 +505,10 @@ class McblendObject:
         Sequence of masks affecting the texture of side 6 of the cube of this
         object.
         '''
-        if self.uv_group == '':
+        uv_group_name = self.uv_group
+        if uv_group_name == '':
             return [ColorMask((1, 1, 0))]
-        uv_group = get_mcblend_uv_groups(bpy.context.scene)[self.uv_group]
+        uv_group = get_mcblend_uv_groups(bpy.context.scene)[uv_group_name]
         return get_masks_from_side(uv_group.side6)
 
     def find_lose_parts(self) -> Tuple[int, ...]:
@@ -452,6 +553,10 @@ FaceName: TypeAlias = Literal[
 FacePattern: TypeAlias = Literal[
     '---', '+--', '-+-', '++-', '--+', '+-+', '-++', '+++']
 
+_BOUND_BOX_PATTERNS: tuple[FacePattern, ...] = (
+    '---', '--+', '-++', '-+-', '+--', '+-+', '+++', '++-')
+'''The names of the vertices of the bound_box of an object in their order.'''
+
 # TODO - CubePolygonsSolver, CubePolygons and CubePolygon is a messy structure
 # maybe CubePolygonsSolver should be removed
 class CubePolygonsSolver:
@@ -477,6 +582,12 @@ class CubePolygonsSolver:
     ]
     FACE_NAMES: ClassVar[list[FaceName]] = [
         'north', 'east', 'south', 'west', 'up', 'down']
+    # The indices of the FACE_PATTERNS identified by the sets of their
+    # vertices (only the face with the same set of vertices can match the
+    # pattern)
+    FACE_PATTERN_INDICES: ClassVar[dict[frozenset[str], int]] = {
+        frozenset(face_pattern): i
+        for i, face_pattern in enumerate(FACE_PATTERNS)}
 
     # key (side, is_mirrored) : value (names of the vertices)
     MC_MAPPING_UV_ORDERS: ClassVar[
@@ -536,16 +647,20 @@ class CubePolygonsSolver:
             complete_face: List[str | None] = []
             for vertex_index in polygon.vertices:
                 complete_face.append(self.solution[vertex_index])
-            for j, face_pattern in enumerate(CubePolygonsSolver.FACE_PATTERNS):
-                if cyclic_equiv(face_pattern, complete_face):
-                    side_name = CubePolygonsSolver.FACE_NAMES[j]
-                    order = CubePolygonsSolver._get_vertices_order(
-                        side_name, mirror, complete_face)
-                    cube_polygons[side_name] = (
-                        CubePolygon(
-                            polygon,
-                            tuple(complete_face),  # type: ignore
-                            order))
+            j = CubePolygonsSolver.FACE_PATTERN_INDICES.get(
+                frozenset(complete_face))  # type: ignore
+            if j is None:
+                continue
+            if cyclic_equiv(
+                    CubePolygonsSolver.FACE_PATTERNS[j], complete_face):
+                side_name = CubePolygonsSolver.FACE_NAMES[j]
+                order = CubePolygonsSolver._get_vertices_order(
+                    side_name, mirror, complete_face)
+                cube_polygons[side_name] = (
+                    CubePolygon(
+                        polygon,
+                        tuple(complete_face),  # type: ignore
+                        order))
         return CubePolygons(**cube_polygons)  # type: ignore
 
     def is_valid(self):
@@ -562,14 +677,15 @@ class CubePolygonsSolver:
                 complete_face[i] = self.solution[vertex_index]
             if None in complete_face:
                 continue  # This face is not complete
-            for j, face_pattern in enumerate(CubePolygonsSolver.FACE_PATTERNS):
-                if used_face_patterns[j]:
-                    continue  # This pattern is used already (don't check that)
-                if cyclic_equiv(face_pattern, complete_face):
-                    used_face_patterns[j] = True
-                    break  # found matching face pattern
-            else:
+            j = CubePolygonsSolver.FACE_PATTERN_INDICES.get(
+                frozenset(complete_face))  # type: ignore
+            if (
+                    j is None or
+                    used_face_patterns[j] or  # This pattern is used already
+                    not cyclic_equiv(
+                        CubePolygonsSolver.FACE_PATTERNS[j], complete_face)):
                 return False  # Matching face_pattern not found
+            used_face_patterns[j] = True
         return True
 
     def solve(self, vertex_index: int=0):
@@ -637,33 +753,22 @@ class CubePolygons(NamedTuple):
 
         # Blender crds (bounding box):
         # 0. ---; 1. --+; 2. -++; 3. -+-; 4. +--; 5. +-+; 6. +++; 7. ++-
-        mmm, mmp, mpp, mpm, pmm, pmp, ppp, ppm = tuple(cube.bound_box)  # type: ignore
+        # The rows of bb_crds are in the order of _BOUND_BOX_PATTERNS.
         # MC:      0+0 top; -00 right; 00- front;
         # Blender: 00+ top; -00 right; 0-0 front
-        bb_crds = {
-            "---": np.array(mmm), "--+": np.array(mmp),
-            "-++": np.array(mpp), "-+-": np.array(mpm),
-            "+--": np.array(pmm), "+-+": np.array(pmp),
-            "+++": np.array(ppp), "++-": np.array(ppm)
-        }
-
-        p_options: List[List[str]] =  []
-        for vertex_id in range(8):
-            vertex_crds = np.array(cube.data.vertices[vertex_id].co)
-            # Find the closest point of bounding box (key from bb_crds)
-            shortest_distance: Optional[float] = None
-            for k, v in bb_crds.items():
-                p_options.append([])
-                curr_distance: float = np.linalg.norm(
-                    v-vertex_crds)  # type: ignore
-                if shortest_distance is None:
-                    shortest_distance = curr_distance
-                    p_options[vertex_id] = [k]
-                elif np.allclose(shortest_distance, curr_distance):
-                    p_options[vertex_id].append(k)
-                elif curr_distance < shortest_distance:
-                    shortest_distance = curr_distance
-                    p_options[vertex_id] = [k]
+        bb_crds = np.array(cube.bound_box)
+        vertices = cube.data.vertices
+        vertices_crds = np.empty(len(vertices) * 3, dtype=np.float32)
+        vertices.foreach_get('co', vertices_crds)
+        # The distances between the vertices and the points of the bounding
+        # box (8x8 array, one row for each vertex)
+        distances = np.linalg.norm(
+            vertices_crds.reshape(-1, 3)[:8, np.newaxis] - bb_crds, axis=-1)
+        # For each vertex, find the closest points of the bounding box
+        closest = np.isclose(distances, distances.min(axis=1, keepdims=True))
+        p_options: List[List[str]] = [
+            [_BOUND_BOX_PATTERNS[i] for i in np.flatnonzero(vertex_closest)]
+            for vertex_closest in closest]
         solver = CubePolygonsSolver(p_options, list(cube.data.polygons))
         if not solver.solve():
             raise ExporterException(
@@ -702,6 +807,16 @@ class CubePolygon(NamedTuple):
     orientation: Tuple[str, str, str, str]
     order: Tuple[int, int, int, int]
 
+    @property
+    def ordered_loop_indices(self) -> npt.NDArray[np.intp]:
+        '''
+        The indices of the loops of this cube polygon in the order defined by
+        self.order (left bottom, right bottom, right top, left top)
+        '''
+        # The indexing must be a tuple to work with numpy, see issue  #111
+        return np.array(
+            self.side.loop_indices, dtype=np.intp)[(self.order,)]
+
     def uv_layer_coordinates(
             self, uv_layer: MeshUVLoopLayer) -> NumpyTable:
         '''
@@ -709,10 +824,8 @@ class CubePolygon(NamedTuple):
         from the uv_layer. The order of the coordinates in the array is
         defined by self.order (left bottom, right bottom, right top, left top)
         '''
-        # The indexing must be a tuple to work with numpy, see issue  #111
-        ordered_loop_indices = np.array(self.side.loop_indices)[(self.order,)]
-        
-        crds = np.array([uv_layer.data[i].uv for i in ordered_loop_indices])
+        uv_data = uv_layer.data
+        crds = np.array([uv_data[i].uv for i in self.ordered_loop_indices])
         return crds
 
     @staticmethod
@@ -772,6 +885,8 @@ class McblendObjectGroup:
         transformation space of the animation. Animating that object is
         equivalent to animating everything else in opposite way.
     '''
+    __slots__ = ('data', 'world_origin')
+
     data: dict[ObjectId, McblendObject]
     world_origin: Object | None
 
@@ -790,6 +905,14 @@ class McblendObjectGroup:
             raise RuntimeError("World origin not defined")
         return self.world_origin.matrix_world
 
+    def clear_cache(self):
+        '''
+        Clears the cached values of all of the :class:`McblendObject`s of this
+        group. See :meth:`McblendObject.clear_cache`.
+        '''
+        for objprop in self.data.values():
+            objprop.clear_cache()
+
     def __len__(self):
         return len(self.data)
 
@@ -823,12 +946,14 @@ class McblendObjectGroup:
         '''
         # This assertion should never raise an exception
         assert isinstance(armature.data, Armature), "Object is not an armature"
+        armature_name = armature.name
         # Loop bones
         for bone in armature.data.bones:
-            obj_id: ObjectId = ObjectId(armature.name, bone.name)
+            obj_id: ObjectId = ObjectId.make(armature_name, bone.name)
             parent_bone_id: Optional[ObjectId] = None
-            if bone.parent is not None:
-                parent_bone_id = ObjectId(armature.name, bone.parent.name)
+            parent_bone = bone.parent
+            if parent_bone is not None:
+                parent_bone_id = ObjectId.make(armature_name, parent_bone.name)
             self.data[obj_id] = McblendObject(
                 thisobj_id=obj_id, thisobj=armature,
                 parentobj_id=parent_bone_id, children_ids=[],
@@ -836,41 +961,78 @@ class McblendObjectGroup:
         for obj in armature.children:
             if obj.parent_type != 'BONE':
                 continue  # TODO - maybe a warning here?
-            if obj.parent is None:
+            parent = obj.parent
+            if parent is None:
+                continue
+            mctype = _OBJ_TYPE_TO_MCTYPE.get(cast(str, obj.type))
+            if mctype is None:
+                continue
+            parentobj_id = ObjectId.make(parent.name, obj.parent_bone)
+            # The children list of the parent bone is shared by the object
+            # and all of its offspring
+            parent_children_ids = self.data[parentobj_id].children_ids
+            obj_id = ObjectId.make(obj.name)
+            self.data[obj_id] = McblendObject(
+                thisobj_id=obj_id, thisobj=obj, parentobj_id=parentobj_id,
+                children_ids=[], mctype=mctype, group=self)
+            parent_children_ids.append(obj_id)
+            if mctype is not MCObjType.CUBE:
                 continue
-            parentobj_id = ObjectId(obj.parent.name, obj.parent_bone)
-            obj_id = ObjectId(obj.name, "")
-            if obj.type  == 'MESH':
-                self.data[obj_id] = McblendObject(
-                    thisobj_id=obj_id, thisobj=obj, parentobj_id=parentobj_id,
-                    children_ids=[], mctype=MCObjType.CUBE, group=self)
-                self.data[parentobj_id].children_ids.append(obj_id)
-                # Further offspring of the "child" (share same parent in mc
-                # model)
-                offspring: deque[Object] = deque(obj.children)
-                while offspring:
-                    child = offspring.pop()
-                    child_id: ObjectId = ObjectId(child.name, "")
-                    if child.parent_type != 'OBJECT':
-                        continue
-                    if child.type == 'MESH':
-                        self.data[child_id] = McblendObject(
-                            thisobj_id=child_id, thisobj=child,
-                            parentobj_id=parentobj_id, children_ids=[],
-                            mctype=MCObjType.CUBE, group=self)
-                        self.data[parentobj_id].children_ids.append(child_id)
-                        offspring.extend(child.children)
-                    elif child.type == 'EMPTY':
-                        self.data[child_id] = McblendObject(
-                            thisobj_id=child_id, thisobj=child,
-                            parentobj_id=parentobj_id, children_ids=[],
-                            mctype=MCObjType.LOCATOR, group=self)
-                        self.data[parentobj_id].children_ids.append(child_id)
-            elif obj.type == 'EMPTY':
-                self.data[obj_id] = McblendObject(
-                    thisobj_id=obj_id, thisobj=obj, parentobj_id=parentobj_id,
-                    children_ids=[], mctype=MCObjType.LOCATOR, group=self)
-                self.data[parentobj_id].children_ids.append(obj_id)
+            # Further offspring of the "child" (share same parent in mc
+            # model)
+            offspring: deque[Object] = deque(obj.children)
+            while offspring:
+                child = offspring.pop()
+                if child.parent_type != 'OBJECT':
+                    continue
+                child_mctype = _OBJ_TYPE_TO_MCTYPE.get(
+                    cast(str, child.type))
+                if child_mctype is None:
+                    continue
+                child_id: ObjectId = ObjectId.make(child.name)
+                self.data[child_id] = McblendObject(
+                    thisobj_id=child_id, thisobj=child,
+                    parentobj_id=parentobj_id, children_ids=[],
+                    mctype=child_mctype, group=self)
+                parent_children_ids.append(child_id)
+                if child_mctype is MCObjType.CUBE:
+                    offspring.extend(child.children)
+
+def _uv_layer_loops(uv_layer: MeshUVLoopLayer) -> Tuple[Any, str]:
+    '''
+    Returns the collection with the UV coordinates of the loops of the UV
+    layer and the name of the property that stores them. Blender 3.5+ exposes
+    the UV attribute directly (uv_layer.uv). The uv_layer.data collection is
+    a slower compatibility layer used only by older versions.
+    '''
+    if hasattr(uv_layer, 'uv'):
+        return uv_layer.uv, 'vector'  # type: ignore
+    return uv_layer.data, 'uv'
+
+def get_uv_layer_crds(
+        uv_layer: MeshUVLoopLayer) -> npt.NDArray[np.float32]:
+    '''
+    Returns the UV coordinates of all of the loops of the UV layer as a Nx2
+    float32 numpy array (read at once).
+
+    :param uv_layer: the UV layer of the mesh.
+    '''
+    loops, attribute = _uv_layer_loops(uv_layer)
+    crds = np.empty((len(loops), 2), dtype=np.float32)
+    loops.foreach_get(attribute, crds.ravel())
+    return crds
+
+def set_uv_layer_crds(
+        uv_layer: MeshUVLoopLayer, crds: npt.NDArray[np.floating[Any]]):
+    '''
+    Sets the UV coordinates of all of the loops of the UV layer at once.
+
+    :param uv_layer: the UV layer of the mesh.
+    :param crds: Nx2 numpy array with the coordinates of the loops.
+    '''
+    loops, attribute = _uv_layer_loops(uv_layer)
+    loops.foreach_set(
+        attribute, np.ascontiguousarray(crds, dtype=np.float32).ravel())
 
 def cyclic_equiv(u: list[Any], v: list[Any]) -> bool:
     '''
@@ -974,20 +1136,6 @@ def fix_cube_rotation(obj: Object):
 
     obj.matrix_local = loc_mat @ counter_rotation @ rot_mat @ scl_mat
 
-def get_vect_json(arr: Iterable[float | int]) -> list[float]:
-    '''
-    Changes the iterable of numbers into basic python list of floats.
-    Values from the original iterable are rounded to the 3rd deimal
-    digit.
-
-    :param arr: an iterable of numbers.
-    '''
-    result = [round(i, 3) for i in arr]
-    for i, _ in enumerate(result):
-        if result[i] == -0.0:
-            result[i] = 0.0
-    return result
-
 def star_pattern_match(text: str, pattern: str) -> bool:
     '''
     Matches text with a pattern that uses "*" as a wildcard which
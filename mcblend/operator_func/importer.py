@@ -16,12 +16,15 @@ from bpy.types import (
 import bpy
 
 from .common import (
-    MINECRAFT_SCALE_FACTOR, CubePolygons, CubePolygon, MeshType)
+    MINECRAFT_SCALE_FACTOR, CubePolygons, CubePolygon, MeshType, XZY_INDICES,
+    get_uv_layer_crds, set_uv_layer_crds)
 from .extra_types import Vector3di, Vector3d, Vector2d
 from .uv import CoordinatesConverter
 from .exception import ImporterException
 from .typed_bpy_access import get_mcblend
 
+_DEG_TO_RAD = math.pi / 180.0
+
 class ErrorLevel(Enum):
     '''
     Used by ModelLoader to indicate that certain errors should break execution
@@ -262,7 +265,7 @@ class ModelLoader:
             for k in data.keys():  # key must be string because its from json
                 if not (
                         k.startswith('geometry.') or
-                        k in ['debug', 'format_version']):
+                        k in ('debug', 'format_version')):
                     self.append_warning(
                         "Invalid geomtetry name. All 1.8.0 model names must "
                         "start with 'geometry.' prefix.", [k])
@@ -1152,7 +1155,7 @@ class ModelLoader:
             messages)
         '''
         result: Dict[str, Any] = {}
-        if self.parser_version in ['1.16.0', '1.12.0', '1.8.0']:
+        if self.parser_version in ('1.16.0', '1.12.0', '1.8.0'):
             success = self._assert_type(
                 'locators property', locators, (dict,),  # type: ignore
                 locators_path, ErrorLevel.WARNING, more="Ignored.")
@@ -1172,7 +1175,7 @@ class ModelLoader:
         :param locator: The locator
         :param locator_path: Path to the locator
         '''
-        if self.parser_version in ['1.16.0', '1.12.0']:
+        if self.parser_version in ('1.16.0', '1.12.0'):
             result: Dict[str, Any] = {"offset": [0, 0, 0], "rotation": [0, 0, 0]}
             if isinstance(locator, list):
                 success = self._assert_vector_type(
@@ -1688,13 +1691,13 @@ def _mc_translate(
     # This assert should never raise an Exception
     assert isinstance(obj.data, Mesh), "The object is not a Mesh"
     pivot_offset = mathutils.Vector(
-        np.array(mcpivot)[[0, 2, 1]] / MINECRAFT_SCALE_FACTOR
+        np.array(mcpivot)[XZY_INDICES] / MINECRAFT_SCALE_FACTOR
     )
     size_offset = mathutils.Vector(
-        (np.array(mcsize)[[0, 2, 1]] / 2) / MINECRAFT_SCALE_FACTOR
+        (np.array(mcsize)[XZY_INDICES] / 2) / MINECRAFT_SCALE_FACTOR
     )
     translation = mathutils.Vector(
-        np.array(mctranslation)[[0, 2, 1]] / MINECRAFT_SCALE_FACTOR
+        np.array(mctranslation)[XZY_INDICES] / MINECRAFT_SCALE_FACTOR
     )
     for vertex in obj.data.vertices:
         vertex.co += (translation - pivot_offset + size_offset)  # type: ignore
@@ -1720,7 +1723,7 @@ def _mc_set_size(
         effective_inflate = inflate/MINECRAFT_SCALE_FACTOR
 
     pos_delta = (
-        (np.array(mcsize)[[0, 2, 1]] / 2) / MINECRAFT_SCALE_FACTOR
+        (np.array(mcsize)[XZY_INDICES] / 2) / MINECRAFT_SCALE_FACTOR
     )
     pos_delta += effective_inflate
     vertices = obj.data.vertices
@@ -1751,7 +1754,7 @@ def _mc_pivot(obj: Object, mcpivot: Vector3d) -> None:
     :param mcpivot: Minecraft object pivot point.
     '''
     translation = mathutils.Vector(
-        np.array(mcpivot)[[0, 2, 1]] / MINECRAFT_SCALE_FACTOR
+        np.array(mcpivot)[XZY_INDICES] / MINECRAFT_SCALE_FACTOR
     )
     obj.location += translation  # type: ignore
 
@@ -1766,8 +1769,13 @@ def _mc_rotate(
     :param mcrotation: Minecraft object rotation.
     '''
 
+    # Swap Y and Z axes, negate the Y rotation and convert to radians
     rotation = mathutils.Euler(  # pylint: disable=too-many-function-args
-        (np.array(mcrotation)[[0, 2, 1]] * np.array([1, 1, -1])) * math.pi/180,
+        (
+            mcrotation[0] * _DEG_TO_RAD,
+            mcrotation[2] * _DEG_TO_RAD,
+            -mcrotation[1] * _DEG_TO_RAD
+        ),
         'XZY'
     )
     obj.rotation_euler.rotate(rotation)
@@ -1786,26 +1794,22 @@ def _set_uv(
     :param uv: UV mapping for each face.
     :param uv_layer: UV layer of the mesh.
     '''
-    uv_data = uv_layer.data
+    # The UVs are collected in a buffer and written to the layer at once
+    loop_uvs = get_uv_layer_crds(uv_layer)
     def set_uv(
             cube_polygon: CubePolygon, size: Vector2d,
             uv: Vector2d):
         cp_loop_indices = cube_polygon.side.loop_indices
-        cp_order = cube_polygon.order
-
-        left_down = cp_loop_indices[cp_order[0]]
-        right_down = cp_loop_indices[cp_order[1]]
-        right_up = cp_loop_indices[cp_order[2]]
-        left_up = cp_loop_indices[cp_order[3]]
-
-        uv_data[left_down].uv = cast(
-            list[float], uv_converter.convert((uv[0], uv[1] + size[1])))
-        uv_data[right_down].uv = cast(
-            list[float], uv_converter.convert((uv[0] + size[0], uv[1] + size[1])))
-        uv_data[right_up].uv = cast(
-            list[float], uv_converter.convert((uv[0] + size[0], uv[1])))
-        uv_data[left_up].uv = cast(
-            list[float], uv_converter.convert((uv[0], uv[1])))
+        # Left down, right down, right up, left up
+        ordered_loop_indices = [cp_loop_indices[i] for i in cube_polygon.order]
+
+        # The converter takes the coordinates as columns
+        loop_uvs[ordered_loop_indices] = uv_converter.convert(np.array([
+            (uv[0], uv[1] + size[1]),
+            (uv[0] + size[0], uv[1] + size[1]),
+            (uv[0] + size[0], uv[1]),
+            (uv[0], uv[1]),
+        ]).T)
 
     # right/left
     set_uv(cube_polygons.east, uv["east"]["uv_size"], uv["east"]["uv"])
@@ -1819,6 +1823,7 @@ def _set_uv(
     set_uv(cube_polygons.up, uv["up"]["uv_size"], uv["up"]["uv"])
     # bottom
     set_uv(cube_polygons.down, uv["down"]["uv_size"], uv["down"]["uv"])
+    set_uv_layer_crds(uv_layer, loop_uvs)
 
 def add_bone(
         edit_bones: ArmatureEditBones,
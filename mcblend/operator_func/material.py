@@ -4,28 +4,37 @@ Everything related to creating materials for the model.
 from typing import Deque, Optional, List, Tuple
 from collections import deque
 
-from bpy.types import Image, Material, Node, NodeTree
+from bpy.types import Image, Material, Node, NodeLinks, NodeTree, Nodes
 import bpy
 
 PADDING = 300
 
-def _create_node_group_defaults(name: str) -> Tuple[NodeTree, Node, Node]:
+def _create_node_group_defaults(
+        name: str) -> Tuple[NodeTree, Nodes, NodeLinks, Node, Node]:
+    '''
+    Creates a node group with default inputs and outputs. Returns the group,
+    the collections of its nodes and links, and its input and output nodes.
+    '''
     group: NodeTree = bpy.data.node_groups.new(name, 'ShaderNodeTree')
+    nodes = group.nodes
+    links = group.links
 
     # create group inputs
-    inputs: Node = group.nodes.new('NodeGroupInput')
+    inputs: Node = nodes.new('NodeGroupInput')
     inputs.location = [0, 0]
-    group.inputs.new('NodeSocketColor','Color')
-    group.inputs.new('NodeSocketFloat','Alpha')
+    group_inputs = group.inputs
+    group_inputs.new('NodeSocketColor','Color')
+    group_inputs.new('NodeSocketFloat','Alpha')
 
     # create group outputs
-    outputs: Node = group.nodes.new('NodeGroupOutput')
+    outputs: Node = nodes.new('NodeGroupOutput')
     outputs.location = [4*PADDING, 0]
-    group.outputs.new('NodeSocketColor','Color')
-    group.outputs.new('NodeSocketFloat','Alpha')
-    group.outputs.new('NodeSocketColor','Emission')
+    group_outputs = group.outputs
+    group_outputs.new('NodeSocketColor','Color')
+    group_outputs.new('NodeSocketFloat','Alpha')
+    group_outputs.new('NodeSocketColor','Emission')
 
-    return group, inputs, outputs
+    return group, nodes, links, inputs, outputs
 
 def create_entity_alphatest_node_group(material: Material, is_first: bool) -> NodeTree:
     '''
@@ -38,21 +47,22 @@ def create_entity_alphatest_node_group(material: Material, is_first: bool) -> No
         return bpy.data.node_groups['entity_alphatest']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults('entity_alphatest')
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
+        'entity_alphatest')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     # In: Alpha -> Math[ADD] -> Math[FLOOR] -> Out: Alpha
-    math_node = group.nodes.new('ShaderNodeMath')
+    math_node = nodes.new('ShaderNodeMath')
     math_node.operation = 'GREATER_THAN'
     math_node.location = [1*PADDING, -1*PADDING]
-    group.links.new(math_node.inputs[0], inputs.outputs[1])
-    group.links.new(outputs.inputs[1], math_node.outputs[0])
+    links.new(math_node.inputs[0], inputs.outputs[1])
+    links.new(outputs.inputs[1], math_node.outputs[0])
     # RGB (black) -> Out: Emission
-    rgb_node = group.nodes.new("ShaderNodeRGB")
+    rgb_node = nodes.new("ShaderNodeRGB")
     rgb_node.outputs['Color'].default_value = [0, 0, 0, 1]  # black
     rgb_node.location = [2*PADDING, -2*PADDING]
-    group.links.new(outputs.inputs[2], rgb_node.outputs[0])
+    links.new(outputs.inputs[2], rgb_node.outputs[0])
 
     return group
 
@@ -69,22 +79,22 @@ def create_entity_alphatest_one_sided_node_group(
         return bpy.data.node_groups['entity_alphatest_one_sided']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults(
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
         'entity_alphatest_one_sided')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     # In: Alpha -> Math[ADD] -> Math[FLOOR] -> Out: Alpha
-    math_node = group.nodes.new('ShaderNodeMath')
+    math_node = nodes.new('ShaderNodeMath')
     math_node.operation = 'GREATER_THAN'
     math_node.location = [1*PADDING, -1*PADDING]
-    group.links.new(math_node.inputs[0], inputs.outputs[1])
-    group.links.new(outputs.inputs[1], math_node.outputs[0])
+    links.new(math_node.inputs[0], inputs.outputs[1])
+    links.new(outputs.inputs[1], math_node.outputs[0])
     # RGB (black) -> Out: Emission
-    rgb_node = group.nodes.new("ShaderNodeRGB")
+    rgb_node = nodes.new("ShaderNodeRGB")
     rgb_node.outputs['Color'].default_value = [0, 0, 0, 1]  # black
     rgb_node.location = [2*PADDING, -2*PADDING]
-    group.links.new(outputs.inputs[2], rgb_node.outputs[0])
+    links.new(outputs.inputs[2], rgb_node.outputs[0])
 
     return group
 
@@ -103,20 +113,21 @@ def create_entity_node_group(material: Material, is_first: bool) -> NodeTree:
         return bpy.data.node_groups['entity']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults('entity')
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
+        'entity')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     # Value (1.0) -> Out: Alpha
-    value_node = group.nodes.new("ShaderNodeValue")
+    value_node = nodes.new("ShaderNodeValue")
     value_node.outputs['Value'].default_value = 1.0
     value_node.location = [2*PADDING, -1*PADDING]
-    group.links.new(outputs.inputs[1], value_node.outputs[0])
+    links.new(outputs.inputs[1], value_node.outputs[0])
     # RGB (black) -> Out: Emission
-    rgb_node = group.nodes.new("ShaderNodeRGB")
+    rgb_node = nodes.new("ShaderNodeRGB")
     rgb_node.outputs['Color'].default_value = [0, 0, 0, 1]  # black
     rgb_node.location = [2*PADDING, -2*PADDING]
-    group.links.new(outputs.inputs[2], rgb_node.outputs[0])
+    links.new(outputs.inputs[2], rgb_node.outputs[0])
 
     return group
 
@@ -132,17 +143,18 @@ def create_entity_alphablend_node_group(material: Material, is_first: bool) -> N
         return bpy.data.node_groups['entity_alphablend']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults('entity_alphablend')
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
+        'entity_alphablend')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     # In: Alpha -> Out: Alpha
-    group.links.new(outputs.inputs[1], inputs.outputs[1])
+    links.new(outputs.inputs[1], inputs.outputs[1])
     # RGB (black) -> Out: Emission
-    rgb_node = group.nodes.new("ShaderNodeRGB")
+    rgb_node = nodes.new("ShaderNodeRGB")
     rgb_node.outputs['Color'].default_value = [0, 0, 0, 1]  # black
     rgb_node.location = [1*PADDING, -1*PADDING]
-    group.links.new(outputs.inputs[2], rgb_node.outputs[0])
+    links.new(outputs.inputs[2], rgb_node.outputs[0])
 
     return group
 
@@ -161,32 +173,33 @@ def create_entity_emissive_node_group(material: Material, is_first: bool) -> Nod
         return bpy.data.node_groups['entity_emissive']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults('entity_emissive')
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
+        'entity_emissive')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     # Value (1.0) -> Out: Alpha
-    value_node = group.nodes.new("ShaderNodeValue")
+    value_node = nodes.new("ShaderNodeValue")
     value_node.outputs['Value'].default_value =  1.0
     value_node.location = [2*PADDING, -1*PADDING]
-    group.links.new(outputs.inputs[1], value_node.outputs[0])
+    links.new(outputs.inputs[1], value_node.outputs[0])
     # In: Color -> ... -> ... -> Vector[MULTIPLY][0] -> Out: Emission
-    vector_node = group.nodes.new('ShaderNodeVectorMath')
+    vector_node = nodes.new('ShaderNodeVectorMath')
     vector_node.operation = 'MULTIPLY'
     vector_node.location = [3*PADDING, -2*PADDING]
-    group.links.new(vector_node.inputs[0], inputs.outputs[0])
-    group.links.new(outputs.inputs[2], vector_node.outputs[0])
+    links.new(vector_node.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[2], vector_node.outputs[0])
     # In: Alpha -> Math[MULTIPLY] -> Math[SUBTRACT][1] -> Vector[MULTIPLY][1]
-    math_1_node = group.nodes.new('ShaderNodeMath')
+    math_1_node = nodes.new('ShaderNodeMath')
     math_1_node.operation = 'MULTIPLY'
     math_1_node.location = [1*PADDING, -2*PADDING]
-    math_2_node = group.nodes.new('ShaderNodeMath')
+    math_2_node = nodes.new('ShaderNodeMath')
     math_2_node.operation = 'SUBTRACT'
     math_2_node.use_clamp = True
     math_2_node.location = [2*PADDING, -2*PADDING]
-    group.links.new(math_1_node.inputs[0], inputs.outputs[1])
-    group.links.new(math_2_node.inputs[1], math_1_node.outputs[0])
-    group.links.new(vector_node.inputs[1], math_2_node.outputs[0])
+    links.new(math_1_node.inputs[0], inputs.outputs[1])
+    links.new(math_2_node.inputs[1], math_1_node.outputs[0])
+    links.new(vector_node.inputs[1], math_2_node.outputs[0])
 
     return group
 
@@ -201,33 +214,34 @@ def create_entity_emissive_alpha_node_group(material: Material, is_first: bool)
         return bpy.data.node_groups['entity_emissive_alpha']
     except:  # pylint: disable=bare-except
         pass
-    group, inputs, outputs = _create_node_group_defaults('entity_emissive_alpha')
+    group, nodes, links, inputs, outputs = _create_node_group_defaults(
+        'entity_emissive_alpha')
 
     # In: Color-> Out: Color
-    group.links.new(outputs.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[0], inputs.outputs[0])
     #  In: Alpha -> MATH[CEIL] -> Out: Alpha
-    math_3_node = group.nodes.new('ShaderNodeMath')
+    math_3_node = nodes.new('ShaderNodeMath')
     math_3_node.operation = 'CEIL'
     math_3_node.location = [2*PADDING, -1*PADDING]
-    group.links.new(math_3_node.inputs[0], inputs.outputs[1])
-    group.links.new(outputs.inputs[1], math_3_node.outputs[0])
+    links.new(math_3_node.inputs[0], inputs.outputs[1])
+    links.new(outputs.inputs[1], math_3_node.outputs[0])
     # In: Color -> ... -> ... -> Vector[MULTIPLY][0] -> Out: Emission
-    vector_node = group.nodes.new('ShaderNodeVectorMath')
+    vector_node = nodes.new('ShaderNodeVectorMath')
     vector_node.operation = 'MULTIPLY'
     vector_node.location = [3*PADDING, -2*PADDING]
-    group.links.new(vector_node.inputs[0], inputs.outputs[0])
-    group.links.new(outputs.inputs[2], vector_node.outputs[0])
+    links.new(vector_node.inputs[0], inputs.outputs[0])
+    links.new(outputs.inputs[2], vector_node.outputs[0])
     # In: Alpha -> Math[MULTIPLY] -> Math[SUBTRACT][1] -> Vector[MULTIPLY][1]
-    math_1_node = group.nodes.new('ShaderNodeMath')
+    math_1_node = nodes.new('ShaderNodeMath')
     math_1_node.operation = 'MULTIPLY'
     math_1_node.location = [1*PADDING, -2*PADDING]
-    math_2_node = group.nodes.new('ShaderNodeMath')
+    math_2_node = nodes.new('ShaderNodeMath')
     math_2_node.operation = 'SUBTRACT'
     math_2_node.use_clamp = True
     math_2_node.location = [2*PADDING, -2*PADDING]
-    group.links.new(math_1_node.inputs[0], inputs.outputs[1])
-    group.links.new(math_2_node.inputs[1], math_1_node.outputs[0])
-    group.links.new(vector_node.inputs[1], math_2_node.outputs[0])
+    links.new(math_1_node.inputs[0], inputs.outputs[1])
+    links.new(math_2_node.inputs[1], math_1_node.outputs[0])
+    links.new(vector_node.inputs[1], math_2_node.outputs[0])
 
     return group
 
@@ -241,8 +255,10 @@ def create_material_mix_node_group() -> NodeTree:
     except:  # pylint: disable=bare-except
         pass
     group = bpy.data.node_groups.new('material_mix', 'ShaderNodeTree')
+    nodes = group.nodes
+    links = group.links
     # create group inputs
-    inputs = group.nodes.new('NodeGroupInput')
+    inputs = nodes.new('NodeGroupInput')
     inputs.location = [0, 0]
     group.inputs.new('NodeSocketColor','Color1')
     group.inputs.new('NodeSocketColor','Color2')
@@ -252,36 +268,42 @@ def create_material_mix_node_group() -> NodeTree:
     group.inputs.new('NodeSocketFloat','Emission2')
 
     # create group outputs
-    outputs = group.nodes.new('NodeGroupOutput')
+    outputs = nodes.new('NodeGroupOutput')
     outputs.location = [2*PADDING, 0]
     group.outputs.new('NodeSocketColor','Color')
     group.outputs.new('NodeSocketFloat','Alpha')
     group.outputs.new('NodeSocketColor','Emission')
 
+    group_in = inputs.outputs
+    group_out = outputs.inputs
+    alpha2_in = group_in['Alpha2']
+
     # Mix colors (Color mix node)
-    mix_colors_node = group.nodes.new('ShaderNodeMixRGB')
+    mix_colors_node = nodes.new('ShaderNodeMixRGB')
     mix_colors_node.location = [1*PADDING, 1*PADDING]
-    group.links.new(mix_colors_node.inputs['Color1'], inputs.outputs['Color1'])
-    group.links.new(mix_colors_node.inputs['Color2'], inputs.outputs['Color2'])
-    group.links.new(mix_colors_node.inputs['Fac'], inputs.outputs['Alpha2'])
-    group.links.new(outputs.inputs['Color'], mix_colors_node.outputs['Color'])
+    mix_colors_in = mix_colors_node.inputs
+    links.new(mix_colors_in['Color1'], group_in['Color1'])
+    links.new(mix_colors_in['Color2'], group_in['Color2'])
+    links.new(mix_colors_in['Fac'], alpha2_in)
+    links.new(group_out['Color'], mix_colors_node.outputs['Color'])
 
     # Mix alpha (Add and clamp aplha)
-    math_node = group.nodes.new('ShaderNodeMath')
+    math_node = nodes.new('ShaderNodeMath')
     math_node.operation = 'MAXIMUM'
     math_node.location = [1*PADDING, 0]
     # math_node.use_clamp = True
-    group.links.new(math_node.inputs[0], inputs.outputs['Alpha1'])
-    group.links.new(math_node.inputs[1], inputs.outputs['Alpha2'])
-    group.links.new(outputs.inputs['Alpha'], math_node.outputs[0])
+    links.new(math_node.inputs[0], group_in['Alpha1'])
+    links.new(math_node.inputs[1], alpha2_in)
+    links.new(group_out['Alpha'], math_node.outputs[0])
 
     # Mix emissions (Color mix node)
-    mix_emissions_node = group.nodes.new('ShaderNodeMixRGB')
+    mix_emissions_node = nodes.new('ShaderNodeMixRGB')
     mix_emissions_node.location = [1*PADDING, -1*PADDING]
-    group.links.new(mix_emissions_node.inputs['Color1'], inputs.outputs['Emission1'])
-    group.links.new(mix_emissions_node.inputs['Color2'], inputs.outputs['Emission2'])
-    group.links.new(mix_emissions_node.inputs['Fac'], inputs.outputs['Alpha2'])
-    group.links.new(outputs.inputs['Emission'], mix_emissions_node.outputs['Color'])
+    mix_emissions_in = mix_emissions_node.inputs
+    links.new(mix_emissions_in['Color1'], group_in['Emission1'])
+    links.new(mix_emissions_in['Color2'], group_in['Emission2'])
+    links.new(mix_emissions_in['Fac'], alpha2_in)
+    links.new(group_out['Emission'], mix_emissions_node.outputs['Color'])
 
     return group
 
@@ -471,11 +493,14 @@ def create_bone_material(
     material.blend_method = 'OPAQUE'
 
     node_tree = material.node_tree
-    output_node = node_tree.nodes['Material Output']
-    bsdf_node = node_tree.nodes["Principled BSDF"]
-    bsdf_node.inputs['Specular'].default_value = 0
-    bsdf_node.inputs['Sheen Tint'].default_value = 0
-    bsdf_node.inputs['Roughness'].default_value = 1
+    nodes = node_tree.nodes
+    links = node_tree.links
+    output_node = nodes['Material Output']
+    bsdf_node = nodes["Principled BSDF"]
+    bsdf_in = bsdf_node.inputs
+    bsdf_in['Specular'].default_value = 0
+    bsdf_in['Sheen Tint'].default_value = 0
+    bsdf_in['Roughness'].default_value = 1
 
     node_groups: Deque[Node] = deque()
     # Test for opaque materials, if you don't find eny enter second loop
@@ -491,17 +516,17 @@ def create_bone_material(
             continue
         # Reach this code only with OPAQUE_MATERIALS (executed onece)
         node_group_data = MATERIALS_MAP[true_material_name](material, i == 0)
-        node_group: Node = node_tree.nodes.new('ShaderNodeGroup')
+        node_group: Node = nodes.new('ShaderNodeGroup')
         node_group.node_tree = node_group_data
         node_group.location = [-3*PADDING, -i*PADDING]
-        image_node = node_tree.nodes.new('ShaderNodeTexImage')
+        image_node = nodes.new('ShaderNodeTexImage')
         image_node.interpolation = 'Closest'
         image_node.image = img
         image_node.location = [-4*PADDING, -i*PADDING]
-        node_tree.links.new(
+        links.new(
             node_group.inputs[0],
             image_node.outputs[0])
-        node_tree.links.new(
+        links.new(
             node_group.inputs[1],
             image_node.outputs[1])
         node_groups.append(node_group)
@@ -516,17 +541,17 @@ def create_bone_material(
             except KeyError:
                 true_material_name = 'entity_alphatest'  # default
             node_group_data = MATERIALS_MAP[true_material_name](material, i == 0)
-            node_group = node_tree.nodes.new('ShaderNodeGroup')
+            node_group = nodes.new('ShaderNodeGroup')
             node_group.node_tree = node_group_data
             node_group.location = [-3*PADDING, -i*PADDING]
-            image_node = node_tree.nodes.new('ShaderNodeTexImage')
+            image_node = nodes.new('ShaderNodeTexImage')
             image_node.interpolation = 'Closest'
             image_node.image = img
             image_node.location = [-4*PADDING, -i*PADDING]
-            node_tree.links.new(
+            links.new(
                 node_group.inputs[0],
                 image_node.outputs[0])
-            node_tree.links.new(
+            links.new(
                 node_group.inputs[1],
                 image_node.outputs[1])
             node_groups.append(node_group)
@@ -535,42 +560,27 @@ def create_bone_material(
     i = 0
     while True:
         if len(node_groups) > 1:
-            connection = node_tree.nodes.new('ShaderNodeGroup')
+            connection = nodes.new('ShaderNodeGroup')
             connection.node_tree = create_material_mix_node_group()
             connection.location = [(i-2)*PADDING, -i*PADDING]
             bottom = node_groups.popleft()
             top = node_groups.popleft()
             node_groups.appendleft(connection)
-            node_tree.links.new(
-                connection.inputs['Color1'],
-                bottom.outputs['Color'])
-            node_tree.links.new(
-                connection.inputs['Alpha1'],
-                bottom.outputs['Alpha'])
-            node_tree.links.new(
-                connection.inputs['Emission1'],
-                bottom.outputs['Emission'])
-            node_tree.links.new(
-                connection.inputs['Color2'],
-                top.outputs['Color'])
-            node_tree.links.new(
-                connection.inputs['Alpha2'],
-                top.outputs['Alpha'])
-            node_tree.links.new(
-                connection.inputs['Emission2'],
-                top.outputs['Emission'])
+            connection_in = connection.inputs
+            bottom_out = bottom.outputs
+            top_out = top.outputs
+            links.new(connection_in['Color1'], bottom_out['Color'])
+            links.new(connection_in['Alpha1'], bottom_out['Alpha'])
+            links.new(connection_in['Emission1'], bottom_out['Emission'])
+            links.new(connection_in['Color2'], top_out['Color'])
+            links.new(connection_in['Alpha2'], top_out['Alpha'])
+            links.new(connection_in['Emission2'], top_out['Emission'])
             i += 1
         elif len(node_groups) == 1:
-            final_node = node_groups[0]
-            node_tree.links.new(
-                bsdf_node.inputs['Base Color'],
-                final_node.outputs['Color'])
-            node_tree.links.new(
-                bsdf_node.inputs['Alpha'],
-                final_node.outputs['Alpha'])
-            node_tree.links.new(
-                bsdf_node.inputs['Emission'],
-                final_node.outputs['Emission'])
+            final_out = node_groups[0].outputs
+            links.new(bsdf_in['Base Color'], final_out['Color'])
+            links.new(bsdf_in['Alpha'], final_out['Alpha'])
+            links.new(bsdf_in['Emission'], final_out['Emission'])
             break
         else:  # shouldn't happen if bone uses any materials
             break
@@ -15,7 +15,8 @@ from bpy.types import MeshUVLoopLayer, MeshPolygon
 
 from .common import (
     MINECRAFT_SCALE_FACTOR, McblendObject, McblendObjectGroup, MCObjType,
-    CubePolygons, CubePolygon, MeshType, NumpyTable
+    CubePolygons, CubePolygon, MeshType, NumpyTable, XZY_INDICES,
+    get_uv_layer_crds
 )
 from .typed_bpy_access import get_mcblend
 from .extra_types import Vector2di, Vector3d, Vector3di
@@ -158,8 +159,7 @@ class BoneExport:
 
         def _scale(objprop: McblendObject) -> NumpyTable:
             '''Scale of a bone'''
-            _, _, scale = objprop.obj_matrix_world.decompose()
-            return np.array(scale.xzy)
+            return np.array(objprop.obj_matrix_world.to_scale().xzy)
 
         # Set locators
         for locatorprop in locator_objs:
@@ -175,7 +175,8 @@ class BoneExport:
 
         # Set cubes
         for cubeprop in cube_objs:
-            if cubeprop.mesh_type is MeshType.CUBE:
+            mesh_type = cubeprop.mesh_type
+            if mesh_type is MeshType.CUBE:
                 try:
                     _c_scale = _scale(cubeprop)
                     c_size = (
@@ -187,21 +188,22 @@ class BoneExport:
                         MINECRAFT_SCALE_FACTOR)
                     c_rot = cubeprop.get_mcrotation(thisobj)
 
-                    if cubeprop.inflate != 0:
-                        c_size = c_size - cubeprop.inflate*2
-                        c_origin = c_origin + cubeprop.inflate
+                    inflate = cubeprop.inflate
+                    if inflate != 0:
+                        c_size = c_size - inflate*2
+                        c_origin = c_origin + inflate
 
                     uv, uv_mirror = uv_factory.get_uv_export(cubeprop, c_size)
 
                     cube = CubeExport(
                         size=c_size, pivot=c_pivot, origin=c_origin,
-                        rotation=c_rot, inflate=cubeprop.inflate, uv=uv,
+                        rotation=c_rot, inflate=inflate, uv=uv,
                         uv_mirror=uv_mirror, mcblend_obj=cubeprop)
                 except ExporterException as e:
                     self.warnings.append(f'{e} Skipped.')
                     continue
                 self.cubes.append(cube)
-            elif cubeprop.mesh_type is MeshType.POLY_MESH:
+            elif mesh_type is MeshType.POLY_MESH:
                 cubeprop.obj_data.calc_normals_split()
                 polygons = cubeprop.obj_data.polygons  # loop ids and vertices
                 vertices = cubeprop.obj_data.vertices  # crds
@@ -218,17 +220,19 @@ class BoneExport:
                 normals: List[List[float]] = []
                 polys: List[List[Vector3di]] = []
                 uvs: List[List[int]] = [list(i.uv) for i in uv_data]
+                bone_scale = (
+                    np.array(thisobj.obj_matrix_world.to_scale()) *
+                    MINECRAFT_SCALE_FACTOR)
                 for vertex in vertices:
                     transformed_vertex = inv_bone_matrix @ vertex.co
                     transformed_vertex = (
-                        np.array(transformed_vertex) * MINECRAFT_SCALE_FACTOR *
-                        np.array(thisobj.obj_matrix_world.to_scale())
-                    )[[0, 2, 1]] + self.pivot
+                        np.array(transformed_vertex) * bone_scale
+                    )[XZY_INDICES] + self.pivot
                     positions.append(list(transformed_vertex))
                 for loop in loops:
                     # pylint: disable=assignment-from-no-return
                     transformed_normal = mathutils.Vector(
-                            np.array(loop.normal)[[0, 2, 1]]
+                            np.array(loop.normal)[XZY_INDICES]
                     ).normalized()
                     normals.append(
                         cast(
@@ -432,21 +436,20 @@ class UvExportFactory:
                 ) from e
 
     def _get_uv(
-            self, uv_layer: MeshUVLoopLayer,
+            self, loop_crds: NumpyTable,
             cube_polygon: CubePolygon, name: str) -> NumpyTable:
         '''
         Get certain UV coordinates identified by a name from a face.
 
+        :param loop_crds: The UV coordinates of all of the loops of the mesh
+            converted to the Minecraft UV space.
         :param cube_polygon: The face of the cube
         :param name: The identifier of a loop in the UV
         '''
         face: MeshPolygon = cube_polygon.side
         name_index = cube_polygon.orientation.index(name)
 
-        uv_layer_data_index = face.loop_indices[name_index]
-        return self.blend_to_mc_converter.convert(
-            np.array(uv_layer.data[uv_layer_data_index].uv)
-        )
+        return loop_crds[face.loop_indices[name_index]]
 
     def _get_standard_cube_uv_export(
             self, cube_polygons: CubePolygons,
@@ -457,22 +460,18 @@ class UvExportFactory:
         ExporterException exception if this kind of mapping is impossible for
         given input.
         '''
+        # Get the coordinates of all of the loops at once and convert them
+        # (the converter takes the coordinates as columns)
+        loop_crds_arr: NumpyTable = self.blend_to_mc_converter.convert(
+            get_uv_layer_crds(uv_layer).T)
         # Get min and max value of he loop coordinates
-        loop_crds_list: List[NumpyTable] = []
-        for loop in uv_layer.data:
-            loop_crds_list.append(
-                self.blend_to_mc_converter.convert(np.array(loop.uv))
-            )
-        loop_crds_arr: NumpyTable = np.vstack(loop_crds_list)
         min_loop_crds: NumpyTable = loop_crds_arr.min(0)  # type: ignore
         # max_loop_crds = loop_crds_arr.max(0)
 
         # Depth width height
-        # first round with get_vect_json to avoid numerical errors and than
+        # first round to 3 decimal places to avoid numerical errors and than
         # round down to int (like minecraft does).
-        w, h, d = [
-            int(i) for i in
-            get_vect_json(cube_size)]
+        w, h, d = [int(round(i, 3)) for i in cube_size]
         expected_shape = np.array([
             [d, d + h],  # north/front LD 0
             [d + w, d + h],  # north/front RD 1
@@ -513,30 +512,30 @@ class UvExportFactory:
         ]]
 
         real_shape = np.array([
-            self._get_uv(uv_layer, cube_polygons.north, '---'),  # north/front LD
-            self._get_uv(uv_layer, cube_polygons.north, '+--'),  # north/front RD
-            self._get_uv(uv_layer, cube_polygons.north, '+-+'),  # north/front RU
-            self._get_uv(uv_layer, cube_polygons.north, '--+'),  # north/front LU
-            self._get_uv(uv_layer, cube_polygons.east, '-+-'),  # east/right LD
-            self._get_uv(uv_layer, cube_polygons.east, '---'),  # east/right RD
-            self._get_uv(uv_layer, cube_polygons.east, '--+'),  # east/right RU
-            self._get_uv(uv_layer, cube_polygons.east, '-++'),  # east/right LU
-            self._get_uv(uv_layer, cube_polygons.south, '++-'),  # south/back LD
-            self._get_uv(uv_layer, cube_polygons.south, '-+-'),  # south/back RD
-            self._get_uv(uv_layer, cube_polygons.south, '-++'),  # south/back RU
-            self._get_uv(uv_layer, cube_polygons.south, '+++'),  # south/back LU
-            self._get_uv(uv_layer, cube_polygons.west, '+--'),  # west/left LD
-            self._get_uv(uv_layer, cube_polygons.west, '++-'),  # west/left RD
-            self._get_uv(uv_layer, cube_polygons.west, '+++'),  # west/left RU
-            self._get_uv(uv_layer, cube_polygons.west, '+-+'),  # west/left LU
-            self._get_uv(uv_layer, cube_polygons.up, '--+'),  # up/up LD
-            self._get_uv(uv_layer, cube_polygons.up, '+-+'),  # up/up RD
-            self._get_uv(uv_layer, cube_polygons.up, '+++'),  # up/up RU
-            self._get_uv(uv_layer, cube_polygons.up, '-++'),  # up/up LU
-            self._get_uv(uv_layer, cube_polygons.down, '---'),  # down/down LD
-            self._get_uv(uv_layer, cube_polygons.down, '+--'),  # down/down RD
-            self._get_uv(uv_layer, cube_polygons.down, '++-'),  # down/down RU
-            self._get_uv(uv_layer, cube_polygons.down, '-+-'),  # down/down LU
+            self._get_uv(loop_crds_arr, cube_polygons.north, '---'),  # north/front LD
+            self._get_uv(loop_crds_arr, cube_polygons.north, '+--'),  # north/front RD
+            self._get_uv(loop_crds_arr, cube_polygons.north, '+-+'),  # north/front RU
+            self._get_uv(loop_crds_arr, cube_polygons.north, '--+'),  # north/front LU
+            self._get_uv(loop_crds_arr, cube_polygons.east, '-+-'),  # east/right LD
+            self._get_uv(loop_crds_arr, cube_polygons.east, '---'),  # east/right RD
+            self._get_uv(loop_crds_arr, cube_polygons.east, '--+'),  # east/right RU
+            self._get_uv(loop_crds_arr, cube_polygons.east, '-++'),  # east/right LU
+            self._get_uv(loop_crds_arr, cube_polygons.south, '++-'),  # south/back LD
+            self._get_uv(loop_crds_arr, cube_polygons.south, '-+-'),  # south/back RD
+            self._get_uv(loop_crds_arr, cube_polygons.south, '-++'),  # south/back RU
+            self._get_uv(loop_crds_arr, cube_polygons.south, '+++'),  # south/back LU
+            self._get_uv(loop_crds_arr, cube_polygons.west, '+--'),  # west/left LD
+            self._get_uv(loop_crds_arr, cube_polygons.west, '++-'),  # west/left RD
+            self._get_uv(loop_crds_arr, cube_polygons.west, '+++'),  # west/left RU
+            self._get_uv(loop_crds_arr, cube_polygons.west, '+-+'),  # west/left LU
+            self._get_uv(loop_crds_arr, cube_polygons.up, '--+'),  # up/up LD
+            self._get_uv(loop_crds_arr, cube_polygons.up, '+-+'),  # up/up RD
+            self._get_uv(loop_crds_arr, cube_polygons.up, '+++'),  # up/up RU
+            self._get_uv(loop_crds_arr, cube_polygons.up, '-++'),  # up/up LU
+            self._get_uv(loop_crds_arr, cube_polygons.down, '---'),  # down/down LD
+            self._get_uv(loop_crds_arr, cube_polygons.down, '+--'),  # down/down RD
+            self._get_uv(loop_crds_arr, cube_polygons.down, '++-'),  # down/down RU
+            self._get_uv(loop_crds_arr, cube_polygons.down, '-+-'),  # down/down LU
         ], dtype=np.float64)
 
         mirror = False
@@ -0,0 +1,32 @@
+# pylint: disable=missing-function-docstring
+'''
+Extra types used only for static type checking.
+'''
+from typing import Iterator, TypeVar, Protocol, TypeAlias
+
+T_co = TypeVar("T_co", covariant=True)
+
+BpyCollectionKey: TypeAlias = int | str
+'''The types of the keys accepted by the collections of blender objects.'''
+
+class BpyCollection(Protocol[T_co]):
+    '''
+    Fake class for any read-only collection of blender objects.
+    '''
+    def __getitem__(self, key: BpyCollectionKey) -> T_co: ...
+    def __iter__(self) -> Iterator[T_co]: ...
+    def __len__(self) -> int: ...
+
+
+class CollectionProperty(BpyCollection[T_co], Protocol[T_co]):
+    '''
+    Fake class for any CollectionProperty.
+    '''
+    def add(self) -> T_co: ...
+    def __contains__(self, key: str) -> bool: ...
+    def remove(self, index: int) -> None:
+        # TODO: I think there is more overloads for this method.
+        ...
+    def clear (self) -> None: ...
+    def keys(self) -> list[str]: ...
+    def move(self, from_index: int, to_index: int) -> None: ...
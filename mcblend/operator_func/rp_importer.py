@@ -4,11 +4,11 @@ Functions related to imoporting models from resource packs.
 from __future__ import annotations
 from typing import Literal, TypedDict, TYPE_CHECKING, Union
 from bpy.types import Context
-from .pyi_types import CollectionProperty
 from .typed_bpy_access import get_mcblend_project
 
 # Import for static type checking only (to avoid circular imports)
 if TYPE_CHECKING:
+    from .pyi_types import CollectionProperty
     from ..resource_pack_data import (
         MCBLEND_AttachableRenderController,
         MCBLEND_EntityRenderController)
@@ -8,12 +8,7 @@ from bpy.types import (
     MeshUVLoop, LayerCollection)
 from mathutils import Matrix, Euler, Vector, Quaternion
 from .common import NumpyTable
-from .pyi_types import (
-    CollectionProperty, DataMeshes, ArmatureDataBones, DataImages,
-    ObjectDataMaterials,
-    MeshUVLoopLayerData, ObjectDataEdges,
-    ArmaturePoseBones,
-    ObjectDataPolygons)
+from .pyi_types import CollectionProperty
 
 from ..object_data import (
     MCBLEND_EventProperties, MCBLEND_ObjectProperties, MCBLEND_BoneProperties)
@@ -4,7 +4,9 @@ Functions related to creating UV map.
 from __future__ import annotations
 
 from typing import (
-    Dict, Tuple, List, Collection, NamedTuple, Sequence, Iterator)
+    Dict, DefaultDict, Tuple, List, Set, Collection, NamedTuple, Sequence,
+    Iterator)
+from collections import defaultdict
 from enum import Enum, auto
 from functools import total_ordering
 import bisect
@@ -14,10 +16,9 @@ import bpy
 
 from .texture_generator import Mask
 from .exception import NotEnoughTextureSpace
-from .json_tools import get_vect_json
 from .common import (
     MINECRAFT_SCALE_FACTOR, McblendObject, McblendObjectGroup, CubePolygon,
-    MeshType, NumpyTable)
+    MeshType, NumpyTable, get_uv_layer_crds, set_uv_layer_crds)
 from .extra_types import Vector2di
 
 
@@ -110,6 +111,17 @@ class Suggestion(NamedTuple):
 
 
 
+def _true_bounds(pos: int, size: int) -> Tuple[int, int]:
+    '''
+    Gets the bounds of an UV coordinate (a pair of numbers with)
+    min and max values. The input is also a pair of numbers, but
+    it represents the coordinate and than a size. The size can be
+    negative which means that the min value is smaller than the 'pos'.
+    '''
+    if size < 0:
+        return (pos + size, pos)
+    return (pos, pos + size)
+
 class UvBox:
     '''Rectangular space on the texture.'''
 
@@ -131,33 +143,26 @@ class UvBox:
         :param other: The other UvBox to test the collision.
         :returns: True if there is a collision.
         '''
-        # min max
-        def _true_bounds(pos: int, size: int) -> Tuple[int, int]:
-            '''
-            Gets the bounds of an UV coordinate (a pair of numbers with)
-            min and max values. The input is also a pair of numbers, but
-            it represents the coordinate and than a size. The size can be
-            negative which means that the min value is smaller than the 'pos'.
-            '''
-            if size < 0:
-                return (pos + size, pos)
-            return (pos, pos + size)
-
-        self_x = _true_bounds(self.uv[0], self.size[0])
-        self_y = _true_bounds(self.uv[1], self.size[1])
+        u_min, u_max, v_min, v_max = self.get_bounds()
         for collider in other.yield_colliders():
-            collider_x = _true_bounds(collider.uv[0], collider.size[0])
-            collider_y = _true_bounds(collider.uv[1], collider.size[1])
-            collides = (
-                self_x[0] < collider_x[1] and
-                collider_x[0] < self_x[1] and
-                self_y[0] < collider_y[1] and
-                collider_y[0] < self_y[1]
-            )
-            if collides:
+            (
+                collider_u_min, collider_u_max,
+                collider_v_min, collider_v_max
+            ) = collider.get_bounds()
+            if (
+                    u_min < collider_u_max and collider_u_min < u_max and
+                    v_min < collider_v_max and collider_v_min < v_max):
                 return True
         return False
 
+    def get_bounds(self) -> Tuple[int, int, int, int]:
+        '''
+        Returns the bounds of the UvBox: min U, max U, min V and max V.
+        '''
+        u_min, u_max = _true_bounds(self.uv[0], self.size[0])
+        v_min, v_max = _true_bounds(self.uv[1], self.size[1])
+        return u_min, u_max, v_min, v_max
+
     def yield_colliders(self) -> Iterator[UvBox]:
         '''
         Yield all UvBoxes that belong to this UvBox. This is used for
@@ -173,30 +178,28 @@ class UvBox:
         :returns: list of suggestions for other UV box to try while looking
             for empty space on the texture.
         '''
-        size = (self.size[0]-1, self.size[1]-1)
-        uv = self.uv
+        u, v = self.uv
+        # The coordinates of the last pixel of the box
+        u_end = u + self.size[0] - 1
+        v_end = v + self.size[1] - 1
         # (near which wall?, which side of the wall?)
         return [
             # U, V-1 BOTTOM_LEFT (top left)
-            Suggestion((uv[0], uv[1] - 1), UvCorner.BOTTOM_LEFT),
+            Suggestion((u, v - 1), UvCorner.BOTTOM_LEFT),
             # U+S, V-1 BOTTOM_RIGHT (top right)
-            Suggestion((uv[0] + size[0], uv[1] - 1), UvCorner.BOTTOM_RIGHT),
+            Suggestion((u_end, v - 1), UvCorner.BOTTOM_RIGHT),
             # U+S+1, V TOP_LEFT (right top)
-            Suggestion((uv[0] + size[0] + 1, uv[1]), UvCorner.TOP_LEFT),
+            Suggestion((u_end + 1, v), UvCorner.TOP_LEFT),
             # U+S+1, V+S BOTTOM_LEFT (right bottom)
-            Suggestion(
-                (uv[0] + size[0] + 1, uv[1] + size[1]), UvCorner.BOTTOM_LEFT
-            ),
+            Suggestion((u_end + 1, v_end), UvCorner.BOTTOM_LEFT),
             # U+S, V+S+1 TOP_RIGHT (bottom right)
-            Suggestion(
-                (uv[0] + size[0], uv[1] + size[1] + 1), UvCorner.TOP_RIGHT
-            ),
+            Suggestion((u_end, v_end + 1), UvCorner.TOP_RIGHT),
             # U, V+S+1 TOP_LEFT (bottom left)
-            Suggestion((uv[0], uv[1] + size[1] + 1), UvCorner.TOP_LEFT),
+            Suggestion((u, v_end + 1), UvCorner.TOP_LEFT),
             # U-1, V+S BOTTOM_RIGHT (left bottom)
-            Suggestion((uv[0] - 1, uv[1] + size[1]), UvCorner.BOTTOM_RIGHT),
+            Suggestion((u - 1, v_end), UvCorner.BOTTOM_RIGHT),
             # U-1,V TOP_RIGHT (left top)
-            Suggestion((uv[0] - 1, uv[1]), UvCorner.TOP_RIGHT),
+            Suggestion((u - 1, v), UvCorner.TOP_RIGHT),
         ]
 
     def apply_suggestion(self, suggestion: Suggestion):
@@ -205,22 +208,25 @@ class UvBox:
 
         :param suggestion: the suggestion.
         '''
-        size = (self.size[0]-1, self.size[1]-1)
-        if suggestion.corner == UvCorner.TOP_LEFT:
-            self.uv = suggestion.position
-        elif suggestion.corner == UvCorner.TOP_RIGHT:
-            self.uv = (
-                suggestion.position[0] - size[0], suggestion.position[1]
-            )
-        elif suggestion.corner == UvCorner.BOTTOM_LEFT:
-            self.uv = (
-                suggestion.position[0], suggestion.position[1] - size[1]
-            )
-        elif suggestion.corner == UvCorner.BOTTOM_RIGHT:
-            self.uv = (
-                suggestion.position[0] - size[0],
-                suggestion.position[1] - size[1]
-            )
+        self.uv = self.get_suggested_uv(suggestion)
+
+    def get_suggested_uv(self, suggestion: Suggestion) -> Vector2di:
+        '''
+        Returns the UV that this UvBox would have after applying the
+        suggestion without changing the UvBox.
+
+        :param suggestion: the suggestion.
+        '''
+        u, v = suggestion.position
+        corner = suggestion.corner
+        if corner == UvCorner.TOP_LEFT:
+            return suggestion.position
+        if corner == UvCorner.TOP_RIGHT:
+            return (u - self.size[0] + 1, v)
+        if corner == UvCorner.BOTTOM_LEFT:
+            return (u, v - self.size[1] + 1)
+        # UvCorner.BOTTOM_RIGHT
+        return (u - self.size[0] + 1, v - self.size[1] + 1)
 
     def paint_texture(self, arr: NumpyTable, resolution: int = 1):
         '''
@@ -284,34 +290,32 @@ class UvMcCubeFace(UvBox):
         self.cube_polygon = cube_polygon
         self.masks = masks
 
-    def set_blender_uv(self, converter: CoordinatesConverter):
+    def get_blender_uv(
+            self, converter: CoordinatesConverter
+        ) -> Tuple[List[int], NumpyTable]:
         '''
-        Sets the UV of a blender object.
+        Returns the indices of the loops of the face of the blender object and
+        their UV coordinates (4x2 array) in the order: left_down, right_down,
+        right_up, left_up.
 
         :param converter: the coordinates converter used to convert from
             Minecraft UV coordinates (used internally by this object) to
             Blender UV coordinates.
         '''
-        # Order of the faces for: left_down, right_down, right_up, left_up
-
         # Cube polygon data
         cp_loop_indices = self.cube_polygon.side.loop_indices
-        cp_order = self.cube_polygon.order
-
-        left_down = cp_loop_indices[cp_order[0]]
-        right_down = cp_loop_indices[cp_order[1]]
-        right_up = cp_loop_indices[cp_order[2]]
-        left_up = cp_loop_indices[cp_order[3]]
-
-        uv_data = self.cube.thisobj.obj_data.uv_layers.active.data
-
-        uv_data[left_down].uv = converter.convert(
-            (self.uv[0], self.uv[1] + self.size[1]))
-        uv_data[right_down].uv = converter.convert(
-            (self.uv[0] + self.size[0], self.uv[1] + self.size[1]))
-        uv_data[right_up].uv = converter.convert(
-            (self.uv[0] + self.size[0], self.uv[1]))
-        uv_data[left_up].uv = converter.convert(self.uv)
+        loop_indices = [cp_loop_indices[i] for i in self.cube_polygon.order]
+
+        u, v = self.uv
+        size_u, size_v = self.size
+        # The converter takes the coordinates as columns
+        crds = converter.convert(np.array([
+            (u, v + size_v),
+            (u + size_u, v + size_v),
+            (u + size_u, v),
+            (u, v),
+        ]).T)
+        return loop_indices, crds
 
     def paint_texture(self, arr: NumpyTable, resolution: int = 1):
         '''
@@ -374,28 +378,33 @@ class UvMcCube(McblendObjUvBox):
         # right/left
         self.side1 = UvMcCubeFace(
             self, cp1, (depth, height),
-            thisobj.side1_uv_masks, uv=(0, depth))
+            thisobj.side1_uv_masks)
         # front
         self.side2 = UvMcCubeFace(
             self, cube_polygons.north, (width, height),
-            thisobj.side2_uv_masks, uv=(depth, depth))
+            thisobj.side2_uv_masks)
         # left/right
         self.side3 = UvMcCubeFace(
             self, cp3, (depth, height),
-            thisobj.side3_uv_masks, uv=(depth + width, depth))
+            thisobj.side3_uv_masks)
         # back
         self.side4 = UvMcCubeFace(
             self, cube_polygons.south, (width, height),
-            thisobj.side4_uv_masks, uv=(2*depth + width, depth))
+            thisobj.side4_uv_masks)
         # top
         self.side5 = UvMcCubeFace(
             self, cube_polygons.up, (width, depth),
-            thisobj.side5_uv_masks, uv=(depth, 0))
+            thisobj.side5_uv_masks)
         # bottom
         self.side6 = UvMcCubeFace(
             self, cube_polygons.down, (width, -depth),
-            thisobj.side6_uv_masks, uv=(depth + width, depth))
+            thisobj.side6_uv_masks)
 
+        self._sides = (
+            self.side1, self.side2, self.side3, self.side4, self.side5,
+            self.side6)
+
+        # The UVs of the sides are set by the uv setter
         self._uv: Vector2di = (0, 0)
         super().__init__(size, None)
 
@@ -407,26 +416,24 @@ class UvMcCube(McblendObjUvBox):
     @uv.setter
     def uv(self, uv: Vector2di) -> None:  # type: ignore
         self._uv = uv
-        self.side1.uv = (uv[0], uv[1] + self.depth)
-        self.side2.uv = (uv[0] + self.depth, uv[1] + self.depth)
-        self.side3.uv = (uv[0] + self.depth + self.width, uv[1] + self.depth)
-        self.side4.uv = (uv[0] + 2*self.depth + self.width, uv[1] + self.depth)
+        u, v = uv
+        depth, width = self.depth, self.width
+        self.side1.uv = (u, v + depth)
+        self.side2.uv = (u + depth, v + depth)
+        self.side3.uv = (u + depth + width, v + depth)
+        self.side4.uv = (u + 2*depth + width, v + depth)
 
-        self.side5.uv = (uv[0] + self.depth, uv[1])
-        self.side6.uv = (uv[0] + self.depth + self.width, uv[1] + self.depth)
+        self.side5.uv = (u + depth, v)
+        self.side6.uv = (u + depth + width, v + depth)
 
     def collides(self, other: UvBox):
-        for i in [
-                self.side1, self.side2, self.side3, self.side4, self.side5,
-                self.side6]:
+        for i in self._sides:
             if i.collides(other):
                 return True
         return False
 
     def yield_colliders(self) -> Iterator[UvBox]:
-        for i in [
-                self.side1, self.side2, self.side3, self.side4, self.side5,
-                self.side6]:
+        for i in self._sides:
             yield from i.yield_colliders()
 
     def suggest_positions(self) -> List[Suggestion]:
@@ -439,46 +446,34 @@ class UvMcCube(McblendObjUvBox):
         '''
         # 0. (top left) 1. (top right) 2. (right top) 3. (right bottom)
         # 4. (bottom right) 5. (bottom left) 6. (left bottom) 7. (left top)
-        result: List[Suggestion] = []
-        result.extend([
-            s for i, s in enumerate(self.side1.suggest_positions())
-            if i in [0, 5, 6]
-        ])
-        result.extend([
-            s for i, s in enumerate(self.side5.suggest_positions())
-            if i in [0, 6, 7]
-        ])
-        result.extend([
-            s for i, s in enumerate(self.side6.suggest_positions())
-            if i in [1, 2, 3]
-        ])
-        result.extend([
-            s for i, s in enumerate(self.side4.suggest_positions())
-            if i in [1, 3, 4]
-        ])
-        return result
+        side1 = self.side1.suggest_positions()
+        side5 = self.side5.suggest_positions()
+        side6 = self.side6.suggest_positions()
+        side4 = self.side4.suggest_positions()
+        return [
+            side1[0], side1[5], side1[6],
+            side5[0], side5[6], side5[7],
+            side6[1], side6[2], side6[3],
+            side4[1], side4[3], side4[4],
+        ]
 
     def set_blender_uv(self, converter: CoordinatesConverter):
-        self.side1.set_blender_uv(converter)
-        self.side2.set_blender_uv(converter)
-        self.side3.set_blender_uv(converter)
-        self.side4.set_blender_uv(converter)
-        self.side5.set_blender_uv(converter)
-        self.side6.set_blender_uv(converter)
+        # The UVs of all of the sides are written to the layer at once
+        uv_layer = self.thisobj.obj_data.uv_layers.active
+        loop_uvs = get_uv_layer_crds(uv_layer)
+        for side in self._sides:
+            loop_indices, crds = side.get_blender_uv(converter)
+            loop_uvs[loop_indices] = crds
+        set_uv_layer_crds(uv_layer, loop_uvs)
 
     def clear_uv_layers(self):
-        while len(self.thisobj.obj_data.uv_layers) > 0:
-            self.thisobj.obj_data.uv_layers.remove(
-                self.thisobj.obj_data.uv_layers[0]
-            )
+        uv_layers = self.thisobj.obj_data.uv_layers
+        while len(uv_layers) > 0:
+            uv_layers.remove(uv_layers[0])
 
     def paint_texture(self, arr: NumpyTable, resolution: int = 1):
-        self.side1.paint_texture(arr, resolution)
-        self.side2.paint_texture(arr, resolution)
-        self.side3.paint_texture(arr, resolution)
-        self.side4.paint_texture(arr, resolution)
-        self.side5.paint_texture(arr, resolution)
-        self.side6.paint_texture(arr, resolution)
+        for side in self._sides:
+            side.paint_texture(arr, resolution)
 
     def new_uv_layer(self):
         self.thisobj.obj_data.uv_layers.new()
@@ -546,6 +541,9 @@ class UvGroup(McblendObjUvBox):
         for obj in self._objects:
             obj.apply_suggestion(suggestion)
 
+    def get_suggested_uv(self, suggestion: Suggestion) -> Vector2di:
+        return self._objects[0].get_suggested_uv(suggestion)
+
     def set_blender_uv(self, converter: CoordinatesConverter):
         for obj in self._objects:
             obj.set_blender_uv(converter)
@@ -631,6 +629,63 @@ class UvModelMerger(McblendObjUvBox):
 
 
 
+class _UvBoxGrid:
+    '''
+    Spatial index of the UvBoxes used for testing the collisions while
+    planning the UV. The bounds of the colliders of the boxes added to the
+    grid are stored in every cell of the grid that they overlap, so a
+    collision test of a box only checks the colliders from the cells
+    overlapped by that box.
+
+    :param cell_size: The width and height of a cell of the grid.
+    '''
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: DefaultDict[
+            Tuple[int, int], List[Tuple[int, int, int, int]]
+        ] = defaultdict(list)
+
+    def _get_cells(
+            self, bounds: Tuple[int, int, int, int]
+        ) -> Iterator[Tuple[int, int]]:
+        '''Yields the keys of the cells overlapped by the bounds.'''
+        cell_size = self.cell_size
+        u_min, u_max, v_min, v_max = bounds
+        for u in range(int(u_min // cell_size), int(u_max // cell_size) + 1):
+            for v in range(
+                    int(v_min // cell_size), int(v_max // cell_size) + 1):
+                yield u, v
+
+    def add(self, box: UvBox):
+        '''Adds the colliders of a mapped UvBox to the grid.'''
+        cells = self.cells
+        for collider in box.yield_colliders():
+            bounds = collider.get_bounds()
+            for cell in self._get_cells(bounds):
+                cells[cell].append(bounds)
+
+    def collides(self, box: UvBox) -> bool:
+        '''
+        Returns True if the UvBox collides with any of the boxes added to
+        the grid. Otherwise returns False.
+        '''
+        cells = self.cells
+        for collider in box.yield_colliders():
+            bounds = collider.get_bounds()
+            u_min, u_max, v_min, v_max = bounds
+            for cell in self._get_cells(bounds):
+                if cell not in cells:
+                    continue
+                for (
+                        other_u_min, other_u_max,
+                        other_v_min, other_v_max) in cells[cell]:
+                    if (
+                            u_min < other_u_max and other_u_min < u_max and
+                            v_min < other_v_max and other_v_min < v_max):
+                        return True
+        return False
+
 class UvMapper:
     '''
     A class that helps with UV mapping.
@@ -664,8 +719,9 @@ class UvMapper:
                 np.array(objprop.obj_matrix_world.to_scale().xzy) * # scale
                 MINECRAFT_SCALE_FACTOR
             )
-            if objprop.inflate != 0:
-                dimensions = dimensions - objprop.inflate * 2
+            inflate = objprop.inflate
+            if inflate != 0:
+                dimensions = dimensions - inflate * 2
             # Apply the min boundaries to the effective scale value
             dimensions_abs = np.maximum(
                 np.abs(dimensions), objprop.min_uv_size)
@@ -674,21 +730,24 @@ class UvMapper:
             dimensions = dimensions_abs
 
             # width, height, depth - rounded down to int
-            # first round with get_json_vect to avoid numerical errors and
+            # first round to 3 decimal places to avoid numerical errors and
             # than round down to int (like minecraft does).
             width, height, depth = [
-                int(i) for i in get_vect_json(dimensions)]
-            if objprop.uv_group != '':
-                curr_key = (width, depth, height, objprop.uv_group)
-                if curr_key in cube_uv_groups:
-                    cube_uv_groups[curr_key].append(
+                int(round(i, 3)) for i in dimensions]
+            uv_group_name = objprop.uv_group
+            if uv_group_name != '':
+                curr_key = (width, depth, height, uv_group_name)
+                uv_group = cube_uv_groups.get(curr_key)
+                if uv_group is not None:
+                    uv_group.append(
                         UvMcCube(width, depth, height, objprop)
                     )
                 else:
-                    cube_uv_groups[curr_key] = UvGroup(
+                    uv_group = UvGroup(
                         UvMcCube(width, depth, height, objprop)
                     )
-                    self.uv_boxes.append(cube_uv_groups[curr_key])
+                    cube_uv_groups[curr_key] = uv_group
+                    self.uv_boxes.append(uv_group)
             else:
                 self.uv_boxes.append(
                     UvMcCube(width, depth, height, objprop)
@@ -711,12 +770,25 @@ class UvMapper:
             self.width = max([self.width, self.uv_boxes[0].size[0]])
 
         suggestions: List[Suggestion] = [Suggestion((0, 0), UvCorner.TOP_LEFT)]
-
-        mapped_boxes: List[McblendObjUvBox] = []
+        # The positions and corners of the suggestions from the list, used for
+        # skipping the duplicates (Suggestion itself isn't hashable)
+        suggested: Set[Tuple[Vector2di, UvCorner]] = {
+            ((0, 0), UvCorner.TOP_LEFT)}
+
+        # The mapped boxes are only used for testing the collisions. The
+        # cells of the grid are as big as the biggest box so that every box
+        # overlaps only a few of them.
+        cell_size = max(
+            (
+                max(abs(int(box.size[0])), abs(int(box.size[1])))
+                for box in self.uv_boxes
+            ),
+            default=1)
+        mapped_boxes = _UvBoxGrid(max(cell_size, 1))
         unmapped_boxes: List[McblendObjUvBox] = []
         for box in self.uv_boxes:
             if box.is_mapped:
-                mapped_boxes.append(box)
+                mapped_boxes.add(box)
             else:
                 unmapped_boxes.append(box)
 
@@ -728,28 +800,35 @@ class UvMapper:
 
         # pylint: disable=too-many-nested-blocks
         for box in unmapped_boxes:
-            for suggestion_i, _ in enumerate(suggestions):
+            for suggestion_i, suggestion in enumerate(suggestions):
+                # Test if box in texture space before applying the
+                # suggestion (applying moves all of the sides of the boxes)
+                suggested_uv = box.get_suggested_uv(suggestion)
+                if _is_out_of_bounds(suggested_uv, box.size):
+                    continue
                 # Apply suggestion
-                box.apply_suggestion(suggestions[suggestion_i])
+                box.uv = suggested_uv
 
-                # Test if box in texture space
-                if _is_out_of_bounds(box.uv, box.size):
-                    continue
                 # Test if suggestion doesn't collide
-                for other_box in mapped_boxes:
-                    if box.collides(other_box):  # Bad suggestion. Find more
-                        break
-                else:  # didn't found collisions. Good suggestion, break the loop
-                    # This modifies the suggestion list but it's ok because
-                    # we are breaking the loop
-                    box.is_mapped = True
-                    mapped_boxes.append(box)
-                    del suggestions[suggestion_i]
-                    for s in box.suggest_positions():
-                        if _is_out_of_bounds(s.position):
-                            continue
-                        bisect.insort(suggestions, s)
-                    break
+                if mapped_boxes.collides(box):  # Bad suggestion. Find more
+                    continue
+                # Didn't found collisions. Good suggestion, break the loop
+                # This modifies the suggestion list but it's ok because
+                # we are breaking the loop
+                box.is_mapped = True
+                mapped_boxes.add(box)
+                used_suggestion = suggestions.pop(suggestion_i)
+                suggested.discard(
+                    (used_suggestion.position, used_suggestion.corner))
+                for s in box.suggest_positions():
+                    if _is_out_of_bounds(s.position):
+                        continue
+                    suggestion_key = (s.position, s.corner)
+                    if suggestion_key in suggested:
+                        continue
+                    suggested.add(suggestion_key)
+                    bisect.insort(suggestions, s)
+                break
             else:  # No good suggestion found for current box.
                 box.uv = (0, 0)
                 raise NotEnoughTextureSpace()
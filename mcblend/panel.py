@@ -5,7 +5,6 @@ This module contains all of the panels for mcblend GUI.
 from typing import List, Optional, Any
 from dataclasses import dataclass
 
-import bpy
 from bpy.types import UILayout, UIList, Panel, Context, Armature
 
 from .object_data import EffectTypes, MCBLEND_EffectProperties
@@ -19,6 +18,52 @@ from .operator_func.typed_bpy_access import (
     get_mcblend_project)
 from .uv_data import MCBLEND_UvMaskProperties
 
+# The values of the enums compared with the properties of the masks and
+# effects while drawing the panels
+_COLOR_PALLETTE_MASK = UvMaskTypes.COLOR_PALLETTE_MASK.value
+_GRADIENT_MASK = UvMaskTypes.GRADIENT_MASK.value
+_ELLIPSE_MASK = UvMaskTypes.ELLIPSE_MASK.value
+_RECTANGLE_MASK = UvMaskTypes.RECTANGLE_MASK.value
+_STRIPES_MASK = UvMaskTypes.STRIPES_MASK.value
+_RANDOM_MASK = UvMaskTypes.RANDOM_MASK.value
+_COLOR_MASK = UvMaskTypes.COLOR_MASK.value
+_MIX_MASK = UvMaskTypes.MIX_MASK.value
+_PARTICLE_EFFECT = EffectTypes.PARTICLE_EFFECT.value
+_SOUND_EFFECT = EffectTypes.SOUND_EFFECT.value
+
+# The flags passed to MCBLEND_PT_UVGroupPanel.draw_mask_properties for each
+# type of mask (except the color pallette mask which can't be put inside
+# the mix mask)
+_MASK_PROPERTIES: dict[str, dict[str, bool]] = {
+    _GRADIENT_MASK: {
+        'p1p2': True, 'stripes': True, 'relative_boundaries': True,
+        'expotent': True},
+    _ELLIPSE_MASK: {
+        'p1p2': True, 'relative_boundaries': True, 'expotent': True,
+        'strength': True, 'hard_edge': True},
+    _RECTANGLE_MASK: {
+        'p1p2': True, 'relative_boundaries': True, 'expotent': True,
+        'strength': True, 'hard_edge': True},
+    _STRIPES_MASK: {
+        'stripes': True, 'relative_boundaries': True, 'horizontal': True},
+    _RANDOM_MASK: {'strength': True, 'expotent': True, 'seed': True},
+    _COLOR_MASK: {'color': True},
+    _MIX_MASK: {
+        'children': True, 'strength': True, 'expotent': True, 'mode': True},
+}
+
+# The icons of the buttons for collapsing and hiding the UV masks, indexed
+# with the current value of the property
+_COLLAPSED_ICONS = ('DISCLOSURE_TRI_DOWN', 'DISCLOSURE_TRI_RIGHT')
+_HIDDEN_ICONS = ('HIDE_OFF', 'HIDE_ON')
+
+# The names of the properties of the UV group with the masks of each side,
+# indexed with the active side
+_UV_GROUP_SIDES = ('side1', 'side2', 'side3', 'side4', 'side5', 'side6')
+
+# The layout types of the UI lists in which the items are drawn
+_UL_LAYOUT_TYPES = frozenset(('DEFAULT', 'COMPACT', 'CENTER'))
+
 # GUI
 # UV groups names list
 class MCBLEND_UL_UVGroupList(UIList):
@@ -51,7 +96,7 @@ class MCBLEND_UL_UVGroupList(UIList):
         For more info see the UI Template called: "UI List Simple".
         '''
         # pylint: disable=arguments-differ, unused-argument
-        if self.layout_type in {'DEFAULT', 'COMPACT', 'CENTER'}:
+        if self.layout_type in _UL_LAYOUT_TYPES:
             # No rename functionality:
             # layout.label(text=item.name, translate=False)
 
@@ -59,7 +104,7 @@ class MCBLEND_UL_UVGroupList(UIList):
             layout.prop(item, "name", text="", emboss=False)
 
 # UV group panel
-@dataclass
+@dataclass(slots=True)
 class _UIStackItem():
     '''
     Object used in MCBLEND_PT_UVGroupPanel for saving the
@@ -75,6 +120,40 @@ class MCBLEND_PT_UVGroupPanel(Panel):
     bl_context = 'scene'
     bl_label = "Mcblend: UV groups"
 
+    def draw_move_remove_buttons(
+            self, row: UILayout, mask_index: int, item_index: int,
+            items_len: int, move_operator: str, remove_operator: str,
+            index_property: str):
+        '''
+        Draws the buttons for moving and removing a color or a stripe of UV
+        mask.
+
+        :param index_property: The name of the property of the remove
+            operator that stores the index of the removed item.
+        '''
+        move_up = item_index > 0
+        move_down = item_index + 1 < items_len
+        # The aligned row is only needed when both of the buttons are drawn
+        up_down_row = row.row(align=True) if move_up and move_down else row
+        # Move down
+        if move_up:
+            op_props = up_down_row.operator(
+                move_operator, icon='TRIA_UP', text='')
+            op_props.mask_index = mask_index
+            op_props.move_from = item_index
+            op_props.move_to = item_index - 1
+        # Move up
+        if move_down:
+            op_props = up_down_row.operator(
+                move_operator, icon='TRIA_DOWN', text='')
+            op_props.mask_index = mask_index
+            op_props.move_from = item_index
+            op_props.move_to = item_index + 1
+        # Delete button
+        op_props = row.operator(remove_operator, icon='X', text='')
+        op_props.mask_index = mask_index
+        setattr(op_props, index_property, item_index)
+
     def draw_colors(
             self, mask: MCBLEND_UvMaskProperties, mask_index: int,
             col: UILayout):
@@ -86,32 +165,15 @@ class MCBLEND_PT_UVGroupPanel(Panel):
             "mcblend.add_uv_mask_color", text="", icon='ADD')
         op_props.mask_index = mask_index
 
-        colors_len = len(mask.colors)
-        for color_index, color in enumerate(mask.colors):
+        colors = mask.colors
+        colors_len = len(colors)
+        for color_index, color in enumerate(colors):
             row = box.row()
             row.prop(color, "color", text="")
-            up_down_row = row.row(align=True)
-            # Move down
-            if color_index - 1 >= 0:
-                op_props = up_down_row.operator(
-                    "mcblend.move_uv_mask_color", icon='TRIA_UP',
-                    text='')
-                op_props.mask_index = mask_index
-                op_props.move_from = color_index
-                op_props.move_to = color_index - 1
-            # Move up
-            if color_index + 1 < colors_len:
-                op_props = up_down_row.operator(
-                    "mcblend.move_uv_mask_color", icon='TRIA_DOWN',
-                    text='')
-                op_props.mask_index = mask_index
-                op_props.move_from = color_index
-                op_props.move_to = color_index + 1
-            # Delete button
-            op_props = row.operator(
-                "mcblend.remove_uv_mask_color", icon='X', text='')
-            op_props.mask_index = mask_index
-            op_props.color_index = color_index
+            self.draw_move_remove_buttons(
+                row, mask_index, color_index, colors_len,
+                "mcblend.move_uv_mask_color", "mcblend.remove_uv_mask_color",
+                "color_index")
 
     def draw_stripes(
             self, mask: MCBLEND_UvMaskProperties, mask_index: int,
@@ -124,40 +186,22 @@ class MCBLEND_PT_UVGroupPanel(Panel):
             "mcblend.add_uv_mask_stripe", text="", icon='ADD')
         op_props.mask_index = mask_index
 
-        stripes_len = len(mask.stripes)
-        for stripe_index, stripe in enumerate(mask.stripes):
+        stripes = mask.stripes
+        stripes_len = len(stripes)
+        # Gradient mask always uses absolute values
+        relative_width = (
+            mask.relative_boundaries and mask.mask_type != _GRADIENT_MASK)
+        for stripe_index, stripe in enumerate(stripes):
             row = box.row()
-            if (
-                    mask.relative_boundaries and
-                    mask.mask_type != UvMaskTypes.GRADIENT_MASK.value):
-                    # Gradient mask always uses absolute values
+            if relative_width:
                 row.prop(stripe, "width_relative")
             else:
                 row.prop(stripe, "width")
             row.prop(stripe, "strength")
-            up_down_row = row.row(align=True)
-            # Move down
-            if stripe_index - 1 >= 0:
-                op_props = up_down_row.operator(
-                    "mcblend.move_uv_mask_stripe", icon='TRIA_UP',
-                    text='')
-                op_props.mask_index = mask_index
-                op_props.move_from = stripe_index
-                op_props.move_to = stripe_index - 1
-            # Move up
-            if stripe_index + 1 < stripes_len:
-                op_props = up_down_row.operator(
-                    "mcblend.move_uv_mask_stripe", icon='TRIA_DOWN',
-                    text='')
-                op_props.mask_index = mask_index
-                op_props.move_from = stripe_index
-                op_props.move_to = stripe_index + 1
-            # Delete button
-            op_props = row.operator(
-                "mcblend.remove_uv_mask_stripe", icon='X',
-                text='')
-            op_props.mask_index = mask_index
-            op_props.stripe_index = stripe_index
+            self.draw_move_remove_buttons(
+                row, mask_index, stripe_index, stripes_len,
+                "mcblend.move_uv_mask_stripe", "mcblend.remove_uv_mask_stripe",
+                "stripe_index")
 
     def draw_mask_properties(
             self, mask: MCBLEND_UvMaskProperties,
@@ -217,6 +261,8 @@ class MCBLEND_PT_UVGroupPanel(Panel):
         between masks like buttons for moving and removing masks.
         '''
         col = None
+        mask_type = mask.mask_type
+        ui_collapsed = mask.ui_collapsed
         # If parent is collapsed don't draw anything
         if ui_stack[-1].ui is not None:
             col = ui_stack[-1].ui
@@ -225,47 +271,42 @@ class MCBLEND_PT_UVGroupPanel(Panel):
             col = box.column()
             row = col.row()
 
-            if mask.ui_collapsed:
-                row.prop(
-                    mask, "ui_collapsed", text="", icon='DISCLOSURE_TRI_RIGHT',
-                    emboss=False)
-            else:
-                row.prop(
-                    mask, "ui_collapsed", text="", icon='DISCLOSURE_TRI_DOWN',
-                    emboss=False)
-            row.label(text=f'{mask.mask_type}')
-            up_down_row = row.row(align=True)
+            row.prop(
+                mask, "ui_collapsed", text="",
+                icon=_COLLAPSED_ICONS[ui_collapsed], emboss=False)
+            row.label(text=f'{mask_type}')
+            move_up = index > 0
+            move_down = index + 1 < masks_len
+            # The aligned row is only needed when both of the buttons are
+            # drawn
+            up_down_row = (
+                row.row(align=True) if move_up and move_down else row)
             # Move down
-            if index - 1 >= 0:
+            if move_up:
                 op_props = up_down_row.operator(
                     "mcblend.move_uv_mask", icon='TRIA_UP',
                     text='')
                 op_props.move_from = index
                 op_props.move_to = index - 1
             # Move up
-            if index + 1 < masks_len:
+            if move_down:
                 op_props = up_down_row.operator(
                     "mcblend.move_uv_mask", icon='TRIA_DOWN',
                     text='')
                 op_props.move_from = index
                 op_props.move_to = index + 1
             # Hide button
-            if mask.ui_hidden:
-                row.prop(
-                    mask, "ui_hidden", text="", icon='HIDE_ON',
-                    emboss=False)
-            else:
-                row.prop(
-                    mask, "ui_hidden", text="", icon='HIDE_OFF',
-                    emboss=False)
+            row.prop(
+                mask, "ui_hidden", text="",
+                icon=_HIDDEN_ICONS[mask.ui_hidden], emboss=False)
             # Delete button
             op_props = row.operator(
                 "mcblend.remove_uv_mask", icon='X', text='')
             op_props.target = index
 
             # Drawing the mask itself unless collapsed
-            if not mask.ui_collapsed:
-                if mask.mask_type == UvMaskTypes.COLOR_PALLETTE_MASK.value:
+            if not ui_collapsed:
+                if mask_type == _COLOR_PALLETTE_MASK:
                     if len(ui_stack) > 1:
                         col.label(
                             text="This mask can't be put inside mix mask",
@@ -274,40 +315,16 @@ class MCBLEND_PT_UVGroupPanel(Panel):
                         self.draw_mask_properties(
                             mask, index, col,
                             colors=True, interpolate=True, normalize=True)
-                if mask.mask_type == UvMaskTypes.GRADIENT_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        p1p2=True, stripes=True, relative_boundaries=True,
-                        expotent=True)
-                if mask.mask_type == UvMaskTypes.ELLIPSE_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        p1p2=True, relative_boundaries=True, expotent=True,
-                        strength=True, hard_edge=True)
-                if mask.mask_type == UvMaskTypes.RECTANGLE_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        p1p2=True, relative_boundaries=True, expotent=True,
-                        strength=True, hard_edge=True)
-                if mask.mask_type == UvMaskTypes.STRIPES_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        stripes=True, relative_boundaries=True, horizontal=True)
-                if mask.mask_type == UvMaskTypes.RANDOM_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        strength=True, expotent=True, seed=True)
-                if mask.mask_type == UvMaskTypes.COLOR_MASK.value:
-                    self.draw_mask_properties(mask, index, col, color=True)
-                if mask.mask_type == UvMaskTypes.MIX_MASK.value:
-                    self.draw_mask_properties(
-                        mask, index, col,
-                        children=True, strength=True, expotent=True,
-                        mode=True)
-
-        if mask.mask_type == UvMaskTypes.MIX_MASK.value and col is not None:
-            # mask.children+1 because it counts itself as a member
-            if not mask.ui_collapsed:
+                else:
+                    mask_properties = _MASK_PROPERTIES.get(mask_type)
+                    if mask_properties is not None:
+                        self.draw_mask_properties(
+                            mask, index, col, **mask_properties)
+
+        if mask_type == _MIX_MASK:
+            # mask.children+1 because it counts itself as a member. The
+            # children are skipped if the mask is collapsed or not drawn.
+            if col is not None and not ui_collapsed:
                 ui_stack.append(_UIStackItem(
                     col.box(), mask.children+1))
             else:
@@ -316,6 +333,7 @@ class MCBLEND_PT_UVGroupPanel(Panel):
 
     def draw(self, context: Context) -> None:
         '''Draws whole UV group panel.'''
+        scene = context.scene
         col = self.layout.column(align=True)
 
 
@@ -325,14 +343,14 @@ class MCBLEND_PT_UVGroupPanel(Panel):
         row_import_export = col.row()
         row_import_export.operator("mcblend.import_uv_group", icon='IMPORT')
 
-        active_uv_group_id = get_mcblend_active_uv_group(bpy.context.scene)
-        uv_groups = get_mcblend_uv_groups(bpy.context.scene)
+        active_uv_group_id = get_mcblend_active_uv_group(scene)
+        uv_groups = get_mcblend_uv_groups(scene)
         col.template_list(
             listtype_name="MCBLEND_UL_UVGroupList",
             list_id="",
-            dataptr=context.scene,  # type: ignore
+            dataptr=scene,  # type: ignore
             propname="mcblend_uv_groups",
-            active_dataptr=context.scene,  # type: ignore
+            active_dataptr=scene,  # type: ignore
             active_propname="mcblend_active_uv_group")
         if active_uv_group_id < len(uv_groups):
             active_uv_group = uv_groups[active_uv_group_id]
@@ -345,7 +363,7 @@ class MCBLEND_PT_UVGroupPanel(Panel):
             row = col.row()
             row.label(text='Side:')
             row.prop(
-                context.scene,  # type: ignore
+                scene,  # type: ignore
                 "mcblend_active_uv_groups_side", expand=True)
             col.separator()
             col.operator('mcblend.copy_uv_group_side', icon='DUPLICATE')
@@ -355,19 +373,15 @@ class MCBLEND_PT_UVGroupPanel(Panel):
                 "mcblend.add_uv_mask", "mask_type",
                 icon="ADD")
             # Draw selected side
-            sides = [
-                active_uv_group.side1, active_uv_group.side2,
-                active_uv_group.side3, active_uv_group.side4,
-                active_uv_group.side5, active_uv_group.side6
-            ]
-            masks = sides[
-                int(get_mcblend_active_uv_groups_side(bpy.context.scene))]
+            side_id = int(get_mcblend_active_uv_groups_side(scene))
+            masks = getattr(active_uv_group, _UV_GROUP_SIDES[side_id])
+            masks_len = len(masks)
             # Stack of UI items to draw in
             ui_stack: List[_UIStackItem] = [
                 _UIStackItem(col, 0)]
             for i, mask in enumerate(masks):
                 col.separator(factor=0.5)
-                self.draw_mask(mask, i, len(masks), ui_stack)
+                self.draw_mask(mask, i, masks_len, ui_stack)
                 # Remove empty ui containers from top of ui_stack
                 while len(ui_stack) > 1:  # Except the first one
                     ui_stack[-1].depth -= 1
@@ -405,7 +419,7 @@ class MCBLEND_UL_EventsList(UIList):
         :param active_property: the name of the active property.
         '''
         # pylint: disable=arguments-differ, unused-argument
-        if self.layout_type in {'DEFAULT', 'COMPACT', 'CENTER'}:
+        if self.layout_type in _UL_LAYOUT_TYPES:
             # No rename functionality:
             # layout.label(text=item.name, translate=False)
 
@@ -427,33 +441,35 @@ class MCBLEND_PT_EventsPanel(Panel):
         box = col.box()
         col = box.column()
         row = col.row()
-        row.label(text=f'{effect.effect_type}')
+        effect_type = effect.effect_type
+        row.label(text=f'{effect_type}')
 
         # Delete button
         op_props = row.operator(
             "mcblend.remove_effect", icon='X', text='')
         op_props.effect_index = index
-        if effect.effect_type == EffectTypes.PARTICLE_EFFECT.value:
+        if effect_type == _PARTICLE_EFFECT:
             col.prop(effect, "effect")
             col.prop(effect, "locator")
             col.prop(effect, "pre_effect_script")
             col.prop(effect, "bind_to_actor")
-        elif effect.effect_type == EffectTypes.SOUND_EFFECT.value:
+        elif effect_type == _SOUND_EFFECT:
             col.prop(effect, "effect")
 
     def draw(self, context: Context):
         '''Draws whole event group panel.'''
+        scene = context.scene
         col = self.layout.column(align=True)
         row = col.row()
 
-        events = get_mcblend_events(bpy.context.scene)
-        active_event_id = get_mcblend_active_event(bpy.context.scene)
+        events = get_mcblend_events(scene)
+        active_event_id = get_mcblend_active_event(scene)
         col.template_list(
             listtype_name="MCBLEND_UL_EventsList",
             list_id="",
-            dataptr=bpy.context.scene,  # type: ignore
+            dataptr=scene,  # type: ignore
             propname="mcblend_events",
-            active_dataptr=bpy.context.scene,  # type: ignore
+            active_dataptr=scene,  # type: ignore
             active_propname="mcblend_active_event")
 
         row.operator("mcblend.add_event", icon='ADD')
@@ -464,10 +480,9 @@ class MCBLEND_PT_EventsPanel(Panel):
             effects = event.effects
             col.operator_menu_enum(
                 "mcblend.add_effect", "effect_type", icon="ADD")
-            if len(effects) > 0:
-                for i, effect in enumerate(effects):
-                    col.separator(factor=0.5)
-                    self.draw_effect(effect, i, col)
+            for i, effect in enumerate(effects):
+                col.separator(factor=0.5)
+                self.draw_effect(effect, i, col)
 
 # Custom object properties panel
 class MCBLEND_PT_ObjectPropertiesPanel(Panel):
@@ -496,7 +511,7 @@ class MCBLEND_PT_ObjectPropertiesPanel(Panel):
             text=""
         )
 
-        mesh_type = get_mcblend(context.object).mesh_type
+        mesh_type = object_properties.mesh_type
         if mesh_type == MeshType.CUBE.value:
             if object_properties.uv_group != '':
                 col.label(
@@ -584,22 +599,24 @@ class MCBLEND_PT_ArmatureRenderControllersPanel(Panel):
 
         row = col.row()
         object_properties = get_mcblend(context.object)
-        len_rc = len(object_properties.render_controllers)
+        render_controllers = object_properties.render_controllers
+        len_rc = len(render_controllers)
+        last_rc_index = len_rc - 1
         op_props = row.operator("mcblend.add_fake_rc", icon='ADD')
         if len_rc > 0:
             row.operator("mcblend.fake_rc_apply_materials", icon='FILE_REFRESH')
         col.separator()
-        for rc_index, rc in enumerate(object_properties.render_controllers):
+        for rc_index, rc in enumerate(render_controllers):
             box = col.box()
             box_col = box.column()
             up_down_row = box_col.row(align=True)
-            if rc_index-1 >= 0:
+            if rc_index > 0:
                 op_props = up_down_row.operator(
                     "mcblend.move_fake_rc", icon='TRIA_UP',
                     text='')
                 op_props.rc_index = rc_index
                 op_props.move_to = rc_index-1
-            if rc_index+1 < len_rc:
+            if rc_index < last_rc_index:
                 op_props = up_down_row.operator(
                     "mcblend.move_fake_rc", icon='TRIA_DOWN',
                     text='')
@@ -634,8 +651,9 @@ class MCBLEND_PT_ArmatureRenderControllersPanel(Panel):
                 text='')
             op_props.rc_index = rc_index
 
-            len_rc_materials = len(rc.materials)
-            for material_index, rc_material in enumerate(rc.materials):
+            rc_materials = rc.materials
+            last_material_index = len(rc_materials) - 1
+            for material_index, rc_material in enumerate(rc_materials):
                 row = box_col.row(align=True)
                 row.prop(
                     rc_material,  # type: ignore
@@ -651,14 +669,14 @@ class MCBLEND_PT_ArmatureRenderControllersPanel(Panel):
                 op_props.rc_index = rc_index
                 op_props.material_index = material_index
                 row.separator()
-                if material_index-1 >= 0:
+                if material_index > 0:
                     op_props = row.operator(
                         "mcblend.move_fake_rc_material", icon='TRIA_UP',
                         text='')
                     op_props.rc_index = rc_index
                     op_props.material_index = material_index
                     op_props.move_to = material_index - 1
-                if material_index+1 < len_rc_materials:
+                if material_index < last_material_index:
                     op_props = row.operator(
                         "mcblend.move_fake_rc_material", icon='TRIA_DOWN',
                         text='')
@@ -700,8 +718,9 @@ class MCBLEND_PT_AnimationPropertiesPanel(Panel):
             "mcblend.add_animation", text="New animation"
         )
 
-        active_anim_id = get_mcblend(context.object).active_animation
-        anims = get_mcblend(context.object).animations
+        object_properties = get_mcblend(context.object)
+        active_anim_id = object_properties.active_animation
+        anims = object_properties.animations
         if active_anim_id < len(anims):
             row.operator("mcblend.remove_animation")
             col.operator_menu_enum(
@@ -722,9 +741,10 @@ class MCBLEND_PT_AnimationPropertiesPanel(Panel):
                 active_anim,  # type: ignore
                 "override_previous_animation",
                 text="Override previous animation")
+            scene = context.scene
             if active_anim.single_frame:
                 col.prop(
-                    bpy.context.scene,  # type: ignore
+                    scene,  # type: ignore
                     "frame_current", text="Frame")
             else:
                 col.prop(
@@ -735,10 +755,10 @@ class MCBLEND_PT_AnimationPropertiesPanel(Panel):
                     "anim_time_update",
                     text="Anim Time Update")
                 col.prop(
-                    bpy.context.scene,  # type: ignore
+                    scene,  # type: ignore
                     "frame_start", text="Frame start")
                 col.prop(
-                    bpy.context.scene,  # type: ignore
+                    scene,  # type: ignore
                     "frame_end", text="Frame end")
 
 # "Other" operators panel
@@ -796,7 +816,8 @@ class MCBLEND_PT_ProjectPanel(Panel):
         col.prop(
             project,  # type: ignore
             "importer_type", text="")
-        if project.importer_type == "ENTITY":
+        importer_type = project.importer_type
+        if importer_type == "ENTITY":
             col.prop_search(
                 data=project,  # type: ignore
                 property="selected_entity",
@@ -825,8 +846,9 @@ class MCBLEND_PT_ProjectPanel(Panel):
                     "textures", text="Texture")
                 materials_box = box.box()
                 materials_box.label(text="Materials")
-                if len(rc.material_patterns) > 0:
-                    for material_pattern in rc.material_patterns:
+                material_patterns = rc.material_patterns
+                if len(material_patterns) > 0:
+                    for material_pattern in material_patterns:
                         materials_box.prop(
                             material_pattern,  # type: ignore
                             "materials",
@@ -836,12 +858,11 @@ class MCBLEND_PT_ProjectPanel(Panel):
                         rc,  # type: ignore
                         "fake_material_patterns", text="*")
 
-            if project.selected_entity in project.entities:
-                col.operator(
-                    "mcblend.import_rp_entity",
-                    text="Import from project"
-                )
-        elif project.importer_type == "ATTACHABLE":
+            col.operator(
+                "mcblend.import_rp_entity",
+                text="Import from project"
+            )
+        elif importer_type == "ATTACHABLE":
             col.prop_search(
                 data=project,  # type: ignore
                 property="selected_attachable",
@@ -870,8 +891,9 @@ class MCBLEND_PT_ProjectPanel(Panel):
                     "textures", text="Texture")
                 materials_box = box.box()
                 materials_box.label(text="Materials")
-                if len(rc.material_patterns) > 0:
-                    for material_pattern in rc.material_patterns:
+                material_patterns = rc.material_patterns
+                if len(material_patterns) > 0:
+                    for material_pattern in material_patterns:
                         materials_box.prop(
                             material_pattern,  # type: ignore
                             "materials",
@@ -881,11 +903,10 @@ class MCBLEND_PT_ProjectPanel(Panel):
                         rc,  # type: ignore
                         "fake_material_patterns", text="*")
 
-            if project.selected_attachable in project.attachables:
-                col.operator(
-                    "mcblend.import_attachable",
-                    text="Import from project"
-                )
+            col.operator(
+                "mcblend.import_attachable",
+                text="Import from project"
+            )
 
 # Resource pack panel
 class MCBLEND_PT_BonePanel(Panel):
@@ -187,7 +187,8 @@ def get_unused_uv_group_name(base_name: str, i: int=1):
     '''
     uv_groups = get_mcblend_uv_groups(bpy.context.scene)
     name = base_name  # f'{base_name}.{i:04}'
-    while name in uv_groups.keys():
+    used_names = set(uv_groups.keys())
+    while name in used_names:
         name = f'{base_name}.{i:04}'
         i += 1
     return name
@@ -237,9 +238,7 @@ def _set_uv_group_name(self: Any, value: str):
         _update_uv_group_name(self, value, update_references)
 
 def _get_uv_group_name(self):
-    if 'name' not in self:
-        return ''
-    return self['name']
+    return self.get('name', '')
 
 class MCBLEND_UvGroupProperties(PropertyGroup):
     '''Properties of UV group.'''
@@ -81,3 +81,30 @@ def test_importer(scene):
     compare_json_files(
         expected_result, result, atol=0.01,
         ignore_order_paths=set_paths)
+
+
+def test_mirrored_cube_scale():
+    '''
+    The size of a mirrored cube uses the sign of the scale from
+    matrix_world.decompose().
+    '''
+    TMP.mkdir(parents=True, exist_ok=True)
+    output = TMP / 'mirrored_cube.geo.json'
+    expected = TMP / 'mirrored_cube.expected.json'
+    blender_run_script(
+        Path('blender_scripts/export_mirrored_model.py').resolve().as_posix(),
+        output.as_posix(), expected.as_posix())
+
+    with output.open('r') as f:
+        result = json.load(f)
+    with expected.open('r') as f:
+        expected_size = json.load(f)['size']
+
+    assert_is_model(result)
+    cubes = [
+        cube
+        for bone in result['minecraft:geometry'][0]['bones']
+        for cube in bone.get('cubes', [])
+    ]
+    assert len(cubes) == 1
+    assert cubes[0]['size'] == pytest.approx(expected_size, abs=0.01)